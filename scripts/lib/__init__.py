@@ -2,12 +2,29 @@
 Self-Hosted AI Platform - Shared Library
 =========================================
 Common utilities for infrastructure automation.
+
+Submodules are imported on first attribute access so that importing
+``lib.config`` does not also pull in the Kubernetes and HTTP client stacks.
 """
 
-from lib.config import Settings, get_settings
-from lib.kubernetes import KubernetesClient
-from lib.secrets import SecretsManager
-from lib.services import ServiceClient
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from lib.config import Settings, get_settings
+    from lib.kubernetes import KubernetesClient
+    from lib.secrets import SecretsManager
+    from lib.services import ServiceClient
+
+_EXPORTS = {
+    "Settings": "lib.config",
+    "get_settings": "lib.config",
+    "KubernetesClient": "lib.kubernetes",
+    "SecretsManager": "lib.secrets",
+    "ServiceClient": "lib.services",
+}
 
 __all__ = [
     "Settings",
@@ -16,3 +33,9 @@ __all__ = [
     "SecretsManager",
     "ServiceClient",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _EXPORTS:
+        return getattr(import_module(_EXPORTS[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
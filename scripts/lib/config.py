@@ -155,6 +155,10 @@ class Settings(BaseSettings):
     def credentials_doc(self) -> Path:
         return self.project_root / "ADMIN_CREDENTIALS.local.md"
 
+    @property
+    def credentials_cache_dir(self) -> Path:
+        return self.secrets_dir / "generated"
+
     def service_url(self, service: str) -> str:
         """Get URL for a service by name."""
         urls = {
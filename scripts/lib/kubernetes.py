@@ -21,6 +21,9 @@ if TYPE_CHECKING:
 
 console = Console()
 
+# Ask list endpoints for metadata only (names, labels, annotations)
+_METADATA_LIST_ACCEPT = "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1"
+
 
 class KubernetesClient:
     """Async Kubernetes client wrapper with convenience methods."""
@@ -183,6 +186,7 @@ class KubernetesClient:
         data: dict[str, str],
         namespace: str | None = None,
         secret_type: str = "Opaque",
+        annotations: dict[str, str] | None = None,
     ) -> "V1Secret":
         """Create a secret from string data."""
         import base64
@@ -193,7 +197,7 @@ class KubernetesClient:
         secret = client.V1Secret(
             api_version="v1",
             kind="Secret",
-            metadata=client.V1ObjectMeta(name=name, namespace=ns),
+            metadata=client.V1ObjectMeta(name=name, namespace=ns, annotations=annotations),
             type=secret_type,
             data=encoded_data,
         )
@@ -204,8 +208,9 @@ class KubernetesClient:
         name: str,
         data: dict[str, str],
         namespace: str | None = None,
+        annotations: dict[str, str] | None = None,
     ) -> "V1Secret":
-        """Update an existing secret."""
+        """Update an existing secret, merging in any given annotations."""
         import base64
 
         ns = namespace or self.settings.namespace_default
@@ -213,8 +218,33 @@ class KubernetesClient:
 
         secret = await self.get_secret(name, ns)
         secret.data = encoded_data
+        if annotations:
+            secret.metadata.annotations = {**(secret.metadata.annotations or {}), **annotations}
         return await self.core_v1.replace_namespaced_secret(name=name, namespace=ns, body=secret)
 
+    async def list_secret_annotations(
+        self, namespace: str | None = None
+    ) -> dict[str, dict[str, str]]:
+        """Map each secret name in a namespace to its annotations in one API call.
+
+        Requests a PartialObjectMetadataList, so the API server returns only
+        object metadata and never the secret data itself.
+        """
+        ns = namespace or self.settings.namespace_default
+        result = await self.core_v1.api_client.call_api(
+            "/api/v1/namespaces/{namespace}/secrets",
+            "GET",
+            path_params={"namespace": ns},
+            header_params={"Accept": _METADATA_LIST_ACCEPT},
+            response_types_map={200: "object"},
+            auth_settings=["BearerToken"],
+            _return_http_data_only=True,
+        )
+        return {
+            item["metadata"]["name"]: item["metadata"].get("annotations") or {}
+            for item in result["items"]
+        }
+
     async def secret_exists(self, name: str, namespace: str | None = None) -> bool:
         """Check if a secret exists."""
         ns = namespace or self.settings.namespace_default
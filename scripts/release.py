@@ -57,6 +57,8 @@ Example:
 
 from __future__ import annotations
 
+import hashlib
+import json
 import os
 import subprocess
 import sys
@@ -97,12 +99,14 @@ class ReleaseConfig:
         version_file: Path to VERSION file
         github_repo: GitHub repository (owner/repo)
         dockerhub_repo: Docker Hub repository
+        cache_dir: Directory for cached git metadata
     """
 
     project_root: Path = field(default_factory=lambda: Path(__file__).parent.parent)
     version_file: Path = field(default=None)
     github_repo: str = "tzervas/self-hosted-ai"
     dockerhub_repo: str = "tzervas01/self-hosted-ai"
+    cache_dir: Path = field(default_factory=lambda: Path.home() / ".cache" / "shai")
 
     def __post_init__(self):
         """Set version_file after project_root is known."""
@@ -159,6 +163,20 @@ class ReleaseManager:
             config: Release configuration. Uses defaults if None.
         """
         self.config = config or ReleaseConfig()
+        self._cat_file: subprocess.Popen[bytes] | None = None
+
+    def __enter__(self) -> ReleaseManager:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the git cat-file coprocess if it was started."""
+        if self._cat_file is not None:
+            self._cat_file.stdin.close()
+            self._cat_file.wait()
+            self._cat_file = None
 
     def get_version(self) -> str:
         """Read current version from VERSION file.
@@ -228,42 +246,108 @@ class ReleaseManager:
             check=check,
         )
 
-    def check_prerequisites(self) -> list[str]:
+    def _git_cat_file(self) -> subprocess.Popen[bytes]:
+        """Get the long-running ``git cat-file --batch-check`` coprocess.
+
+        Object lookups are streamed through a single process instead of
+        spawning one git invocation per object.
+
+        Returns:
+            The running coprocess.
+        """
+        if self._cat_file is None:
+            self._cat_file = subprocess.Popen(
+                ["git", "-C", str(self.config.project_root), "cat-file", "--batch-check"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        return self._cat_file
+
+    def _differs_from_remote(self, local_sha: str, ahead_behind: tuple[int, int] | None) -> bool:
+        """Whether HEAD differs from origin/main.
+
+        Compares against the remote SHA via ls-remote without fetching any
+        objects. If the remote cannot be reached, falls back to the upstream
+        ahead/behind counts as of the last fetch.
+
+        Args:
+            local_sha: Current HEAD commit.
+            ahead_behind: Commits ahead of and behind the upstream, if tracked.
+
+        Returns:
+            True if the local branch is ahead of or behind the remote.
+        """
+        result = self._run_git("ls-remote", "--heads", "origin", "main", check=False)
+        remote_sha = result.stdout.split(maxsplit=1)[0] if result.stdout else ""
+        if remote_sha:
+            return bool(local_sha) and local_sha != remote_sha
+        return ahead_behind is not None and ahead_behind != (0, 0)
+
+    def check_prerequisites(
+        self, remote_check: bool = True, gh_check: bool | None = None
+    ) -> list[str]:
         """Validate prerequisites for creating a release.
 
         Checks:
         - On main branch
         - No uncommitted changes
-        - Up to date with remote
-        - Docker available
+        - Up to date with remote (unless remote_check is False)
         - GitHub CLI authenticated
 
+        Args:
+            remote_check: Compare HEAD against origin/main via ls-remote,
+                falling back to the upstream ahead/behind counts from the
+                last fetch when the remote cannot be reached.
+            gh_check: Check GitHub CLI authentication. By default it runs
+                only once the git checks pass, and not at all when
+                SHAI_SKIP_GH_CHECK=1.
+
         Returns:
             List of error messages (empty if all checks pass).
         """
         errors = []
 
-        # Check branch
-        result = self._run_git("branch", "--show-current", check=False)
-        if result.returncode == 0:
-            branch = result.stdout.strip()
-            if branch != "main":
-                errors.append(f"Must be on main branch (current: {branch})")
-        else:
+        # Branch, HEAD commit and dirty state in a single git call
+        result = self._run_git(
+            "status",
+            "--porcelain=v2",
+            "--branch",
+            "--untracked-files=no",
+            check=False,
+        )
+        if result.returncode != 0:
             errors.append("Cannot determine current branch")
+        else:
+            branch = ""
+            local_sha = ""
+            ahead_behind = None
+            dirty = False
+            for line in result.stdout.splitlines():
+                if line.startswith("# branch.head "):
+                    branch = line.split(" ", 2)[2]
+                elif line.startswith("# branch.oid "):
+                    local_sha = line.split(" ", 2)[2]
+                elif line.startswith("# branch.ab "):
+                    # "+<ahead> -<behind>" against the upstream as last fetched
+                    ahead, behind = line.split(" ")[2:4]
+                    ahead_behind = (int(ahead), -int(behind))
+                elif not line.startswith("#"):
+                    dirty = True
 
-        # Check for uncommitted changes
-        result = self._run_git("diff", "--quiet", "HEAD", check=False)
-        if result.returncode != 0:
-            errors.append("Working directory has uncommitted changes")
+            if branch != "main":
+                errors.append(f"Must be on main branch (current: {branch})")
+            if dirty:
+                errors.append("Working directory has uncommitted changes")
 
-        # Check sync with remote
-        self._run_git("fetch", "origin", "main", check=False)
-        local_sha = self._run_git("rev-parse", "HEAD", check=False).stdout.strip()
-        remote_sha = self._run_git("rev-parse", "origin/main", check=False).stdout.strip()
+            if remote_check and self._differs_from_remote(local_sha, ahead_behind):
+                errors.append("Local main is not up to date with origin/main")
 
-        if local_sha and remote_sha and local_sha != remote_sha:
-            errors.append("Local main is not up to date with origin/main")
+        if gh_check is None:
+            # Only consult gh once the git checks pass
+            gh_check = not errors and os.environ.get("SHAI_SKIP_GH_CHECK") != "1"
+        if not gh_check:
+            return errors
 
         # Check gh CLI
         try:
@@ -324,17 +408,88 @@ class ReleaseManager:
         Returns:
             List of tag names, most recent first.
         """
+        return list(self.get_tag_index(count))
+
+    def get_tag_index(self, count: int = 5) -> dict[str, str]:
+        """Get the most recent git tags with the commits they point at.
+
+        The result is cached on disk keyed by a digest of every tag ref and
+        its object, so repeated calls on an unchanged repository cost one
+        cheap ``git for-each-ref`` and no tag resolution.
+
+        Args:
+            count: Number of tags to return.
+
+        Returns:
+            Mapping of tag name to commit SHA, most recent first.
+        """
+        result = self._run_git(
+            "for-each-ref",
+            "--format=%(refname) %(objectname)",
+            "refs/tags",
+            check=False,
+        )
+        if result.returncode != 0:
+            return {}
+
+        digest = hashlib.blake2b(f"{count}\n{result.stdout}".encode(), digest_size=16)
+        cache_path = self.config.cache_dir / f"tags-{digest.hexdigest()}.json"
+        try:
+            return json.loads(cache_path.read_text())
+        except (OSError, ValueError):
+            pass
+
+        tags = self._list_tags(count)
+        commits = self.get_tag_commits(tags)
+        index = {tag: commits.get(tag, "") for tag in tags}
+
+        try:
+            self.config.cache_dir.mkdir(parents=True, exist_ok=True)
+            for stale in self.config.cache_dir.glob("tags-*.json"):
+                stale.unlink(missing_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(index))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # Caching is best-effort
+        return index
+
+    def _list_tags(self, count: int) -> list[str]:
+        """List the most recent tag names straight from git."""
         result = self._run_git(
-            "tag",
-            "-l",
+            "for-each-ref",
             "--sort=-version:refname",
+            f"--count={count}",
+            "--format=%(refname:short)",
+            "refs/tags",
             check=False,
         )
         if result.returncode == 0:
-            tags = result.stdout.strip().split("\n")
-            return [t for t in tags[:count] if t]
+            return [t for t in result.stdout.split("\n") if t]
         return []
 
+    def get_tag_commits(self, tags: list[str]) -> dict[str, str]:
+        """Resolve tags to the commits they point at.
+
+        Annotated tags are peeled to their commit through the cat-file
+        coprocess, so any number of tags costs a single git process.
+
+        Args:
+            tags: Tag names to resolve.
+
+        Returns:
+            Mapping of tag name to commit SHA (unresolvable tags omitted).
+        """
+        proc = self._git_cat_file()
+        commits = {}
+        for tag in tags:
+            proc.stdin.write(f"refs/tags/{tag}^{{commit}}\n".encode())
+            proc.stdin.flush()
+            fields = proc.stdout.readline().decode().split()
+            if len(fields) == 3 and fields[1] == "commit":
+                commits[tag] = fields[0]
+        return commits
+
     def create_release(
         self,
         version: str,
@@ -433,6 +588,30 @@ class ReleaseManager:
 # =============================================================================
 
 
+def _render_release_result(result: ReleaseResult) -> None:
+    """Print the outcome of a release, exiting non-zero on failure.
+
+    Args:
+        result: Result returned by ReleaseManager.create_release.
+
+    Raises:
+        typer.Exit: If the release failed.
+    """
+    if result.success:
+        console.print(
+            Panel(
+                f"[green]Released version {result.version}[/green]\n\n"
+                f"Tag: {result.tag}\n"
+                f"URL: {result.release_url or 'N/A'}",
+                title="✓ Release Complete",
+                border_style="green",
+            )
+        )
+    else:
+        console.print(f"[red]Release failed:[/red] {result.message}")
+        raise typer.Exit(1)
+
+
 @app.command()
 def bump(
     bump_type: Annotated[
@@ -443,6 +622,10 @@ def bump(
         bool,
         typer.Option("--dry-run", "-n", help="Show what would be done"),
     ] = False,
+    no_remote_check: Annotated[
+        bool,
+        typer.Option("--no-remote-check", help="Skip comparing HEAD with origin/main"),
+    ] = False,
 ) -> None:
     """Bump version and create release.
 
@@ -457,7 +640,7 @@ def bump(
 
     # Check prerequisites
     if not dry_run:
-        errors = manager.check_prerequisites()
+        errors = manager.check_prerequisites(remote_check=not no_remote_check)
         if errors:
             console.print("[red]Pre-release checks failed:[/red]")
             for error in errors:
@@ -473,20 +656,7 @@ def bump(
 
     # Create release
     result = manager.create_release(new_version, dry_run)
-
-    if result.success:
-        console.print(
-            Panel(
-                f"[green]Released version {result.version}[/green]\n\n"
-                f"Tag: {result.tag}\n"
-                f"URL: {result.release_url or 'N/A'}",
-                title="✓ Release Complete",
-                border_style="green",
-            )
-        )
-    else:
-        console.print(f"[red]Release failed:[/red] {result.message}")
-        raise typer.Exit(1)
+    _render_release_result(result)
 
 
 @app.command()
@@ -499,6 +669,10 @@ def tag(
         bool,
         typer.Option("--dry-run", "-n", help="Show what would be done"),
     ] = False,
+    no_remote_check: Annotated[
+        bool,
+        typer.Option("--no-remote-check", help="Skip comparing HEAD with origin/main"),
+    ] = False,
 ) -> None:
     """Tag a specific version and create release.
 
@@ -511,7 +685,7 @@ def tag(
 
     # Check prerequisites
     if not dry_run:
-        errors = manager.check_prerequisites()
+        errors = manager.check_prerequisites(remote_check=not no_remote_check)
         if errors:
             console.print("[red]Pre-release checks failed:[/red]")
             for error in errors:
@@ -521,20 +695,7 @@ def tag(
 
     # Create release
     result = manager.create_release(version, dry_run)
-
-    if result.success:
-        console.print(
-            Panel(
-                f"[green]Released version {result.version}[/green]\n\n"
-                f"Tag: {result.tag}\n"
-                f"URL: {result.release_url or 'N/A'}",
-                title="✓ Release Complete",
-                border_style="green",
-            )
-        )
-    else:
-        console.print(f"[red]Release failed:[/red] {result.message}")
-        raise typer.Exit(1)
+    _render_release_result(result)
 
 
 @app.command()
@@ -544,10 +705,10 @@ def status() -> None:
     Displays the current version from VERSION file, recent tags,
     and configured registries.
     """
-    manager = ReleaseManager()
-
-    current = manager.get_version()
-    tags = manager.get_latest_tags()
+    with ReleaseManager() as manager:
+        current = manager.get_version()
+        commits = manager.get_tag_index()
+    tags = list(commits)
 
     console.print(Panel(f"[bold]Current Version:[/bold] {current}"))
     console.print()
@@ -555,12 +716,13 @@ def status() -> None:
     # Recent tags
     table = Table(title="Recent Tags")
     table.add_column("Tag")
+    table.add_column("Commit", style="dim")
 
     if tags:
         for tag in tags:
-            table.add_row(tag)
+            table.add_row(tag, commits.get(tag, "")[:12])
     else:
-        table.add_row("[dim]No tags yet[/dim]")
+        table.add_row("[dim]No tags yet[/dim]", "")
 
     console.print(table)
     console.print()
@@ -572,7 +734,12 @@ def status() -> None:
 
 
 @app.command()
-def check() -> None:
+def check(
+    no_remote_check: Annotated[
+        bool,
+        typer.Option("--no-remote-check", help="Skip comparing HEAD with origin/main"),
+    ] = False,
+) -> None:
     """Run pre-release checks.
 
     Validates that all prerequisites are met for creating a release:
@@ -580,20 +747,28 @@ def check() -> None:
     - No uncommitted changes
     - Up to date with remote
     - GitHub CLI authenticated
+
+    The remote and GitHub CLI checks are reported as skipped under
+    --no-remote-check and SHAI_SKIP_GH_CHECK=1 respectively.
     """
     console.print(Panel("[bold blue]Pre-Release Checks[/bold blue]"))
 
+    skip_gh = os.environ.get("SHAI_SKIP_GH_CHECK") == "1"
     manager = ReleaseManager()
-    errors = manager.check_prerequisites()
+    errors = manager.check_prerequisites(remote_check=not no_remote_check, gh_check=not skip_gh)
 
+    # None marks a check that did not run
     checks = [
-        ("Main branch", "On main branch" not in str(errors)),
+        ("Main branch", "on main branch" not in str(errors)),
         ("Clean working directory", "uncommitted changes" not in str(errors)),
-        ("Synced with remote", "not up to date" not in str(errors)),
-        ("GitHub CLI", "gh" not in str(errors).lower()),
+        ("Synced with remote", None if no_remote_check else "not up to date" not in str(errors)),
+        ("GitHub CLI", None if skip_gh else "gh" not in str(errors).lower()),
     ]
 
     for name, passed in checks:
+        if passed is None:
+            console.print(f"  [dim]- {name} (skipped)[/dim]")
+            continue
         status = "[green]✓[/green]" if passed else "[red]✗[/red]"
         console.print(f"  {status} {name}")
 
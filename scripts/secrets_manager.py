@@ -6,21 +6,24 @@ Generate, rotate, and export credentials for the Self-Hosted AI Platform.
 
 from __future__ import annotations
 
-import asyncio
 import os
+import re
 import sys
 from enum import Enum
+from functools import cache
 from pathlib import Path
-from typing import Annotated, Optional
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Annotated, Any, Coroutine, Optional, TypeVar
 
 import typer
 from rich.console import Console
 from rich.panel import Panel
-from rich.table import Table
 
 from lib.config import get_settings
-from lib.kubernetes import kubernetes_client
-from lib.secrets import SecretsManager, generate_password
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime to keep --help and shell completion fast
+    from lib.secrets import SecretsManager
 
 app = typer.Typer(
     name="shai-secrets",
@@ -29,6 +32,54 @@ app = typer.Typer(
 )
 console = Console()
 
+T = TypeVar("T")
+
+# Records the hash of the last applied secret data on each managed Secret
+CONTENT_HASH_ANNOTATION = "shai.io/content-hash"
+
+# Masks quoted secret values in the credentials document, applied per line
+_MASK_RE = re.compile(rb'(password|key|secret|token):\s*"[^"]+"', re.IGNORECASE)
+_MASK = b': "********"'
+
+
+@cache
+def _hyperscan_db():
+    """Compile the mask pattern with Hyperscan when it is installed, else None."""
+    try:
+        import hyperscan
+    except ImportError:
+        return None
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[_MASK_RE.pattern],
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST],
+    )
+    return db
+
+
+def _mask_line(line: bytes) -> bytes:
+    """Replace secret values on a line, keeping the key name."""
+    db = _hyperscan_db()
+    if db is None:
+        return _MASK_RE.sub(rb"\1" + _MASK, line)
+
+    spans: list[tuple[int, int]] = []
+
+    def _on_match(_id: int, start: int, end: int, _flags: int, _ctx: object) -> None:
+        spans.append((start, end))
+
+    db.scan(line, match_event_handler=_on_match)
+    masked = bytearray()
+    pos = 0
+    for start, end in spans:
+        if start < pos:
+            continue
+        # Keep everything up to the colon that ends the matched key name
+        masked += line[pos : line.index(b":", start)] + _MASK
+        pos = end
+    masked += line[pos:]
+    return bytes(masked)
+
 
 class SecretsMode(str, Enum):
     GENERATE = "generate"
@@ -39,11 +90,55 @@ class SecretsMode(str, Enum):
 class OutputFormat(str, Enum):
     MARKDOWN = "markdown"
     YAML = "yaml"
+    JSON = "json"
     BOTH = "both"
 
 
+# Map environment variables to (namespace, secret name, key)
+ENV_SECRET_MAPPINGS: dict[str, tuple[str, str, str]] = {
+    "ARGOCD_ADMIN_PASSWORD": ("argocd", "argocd-initial-admin-secret", "password"),
+    "OPENWEBUI_SECRET_KEY": ("self-hosted-ai", "webui-secret", "secret-key"),
+    "OPENWEBUI_ADMIN_PASSWORD": ("self-hosted-ai", "webui-secret", "admin-password"),
+    "LITELLM_MASTER_KEY": ("self-hosted-ai", "litellm-secret", "master-key"),
+    "POSTGRESQL_PASSWORD": ("self-hosted-ai", "postgresql-secret", "postgres-password"),
+    "REDIS_PASSWORD": ("self-hosted-ai", "redis-secret", "redis-password"),
+    "N8N_ENCRYPTION_KEY": ("automation", "n8n-secret", "N8N_ENCRYPTION_KEY"),
+    "GRAFANA_ADMIN_PASSWORD": ("monitoring", "grafana-secret", "admin-password"),
+}
+
+
+@app.callback()
+def _root(ctx: typer.Context) -> None:
+    """Load settings once and share them with the invoked command."""
+    ctx.obj = SimpleNamespace(settings=get_settings(), manager=None)
+
+
+def _run(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion, on a uvloop event loop when installed."""
+    import asyncio
+
+    try:
+        import uvloop
+    except ImportError:
+        loop_factory = None
+    else:
+        loop_factory = uvloop.new_event_loop
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(coro)
+
+
+def _get_manager(ctx: typer.Context) -> SecretsManager:
+    """Get the SecretsManager shared across this invocation."""
+    from lib.secrets import SecretsManager
+
+    if ctx.obj.manager is None:
+        ctx.obj.manager = SecretsManager(ctx.obj.settings)
+    return ctx.obj.manager
+
+
 @app.command()
 def generate(
+    ctx: typer.Context,
     output: Annotated[
         OutputFormat,
         typer.Option("--format", "-f", help="Output format"),
@@ -60,14 +155,30 @@ def generate(
         bool,
         typer.Option("--dry-run", help="Show what would be done without making changes"),
     ] = False,
+    force: Annotated[
+        bool,
+        typer.Option("--force", help="Regenerate even if cached credentials match settings"),
+    ] = False,
 ) -> None:
-    """Generate new credentials for all services."""
-    settings = get_settings()
-    manager = SecretsManager(settings)
+    """Generate new credentials for all services.
+
+    Credentials generated for the same settings are cached and reused, so
+    re-exporting the document does not rotate anything. Use --force to
+    generate fresh values.
+    """
+    from rich.table import Table
 
-    console.print("[bold blue]Generating credentials for all services...[/bold blue]")
+    settings = ctx.obj.settings
+    manager = _get_manager(ctx)
 
-    credentials = manager.generate_all()
+    credentials = None if force else manager.load_cached()
+    if credentials is not None:
+        console.print("[dim]Reusing cached credentials (use --force to regenerate)[/dim]")
+    else:
+        console.print("[bold blue]Generating credentials for all services...[/bold blue]")
+        credentials = manager.generate_all()
+        if not dry_run:
+            manager.save_cached()
     manager.update_litellm_database_url()
 
     # Display summary
@@ -87,9 +198,12 @@ def generate(
 
     console.print(table)
 
-    # Determine output path
+    # Determine output path; YAML and JSON sit next to the Markdown document
+    # rather than overwriting it
     if output_path is None:
         output_path = settings.credentials_doc
+        if output in (OutputFormat.YAML, OutputFormat.JSON):
+            output_path = output_path.with_suffix(f".{output.value}")
 
     # Export based on format
     if output in (OutputFormat.MARKDOWN, OutputFormat.BOTH):
@@ -108,9 +222,16 @@ def generate(
             manager.export_to_yaml(yaml_path)
             console.print(f"[green]✓[/green] Wrote YAML to: {yaml_path}")
 
+    if output == OutputFormat.JSON:
+        if dry_run:
+            console.print(f"[dim]Would write JSON to: {output_path}[/dim]")
+        else:
+            manager.export_to_json(output_path)
+            console.print(f"[green]✓[/green] Wrote JSON to: {output_path}")
+
     # Apply to Kubernetes if requested
     if apply and not dry_run:
-        asyncio.run(_apply_secrets(credentials))
+        _run(_apply_secrets(credentials))
 
     console.print(
         Panel(
@@ -124,6 +245,7 @@ def generate(
 
 @app.command()
 def rotate(
+    ctx: typer.Context,
     service: Annotated[
         Optional[str],
         typer.Option("--service", "-s", help="Specific service to rotate"),
@@ -146,8 +268,8 @@ def rotate(
         console.print("[red]Error:[/red] Specify --service or --all")
         raise typer.Exit(1)
 
-    settings = get_settings()
-    manager = SecretsManager(settings)
+    settings = ctx.obj.settings
+    manager = _get_manager(ctx)
 
     if all_services:
         console.print("[bold yellow]Rotating ALL credentials...[/bold yellow]")
@@ -155,21 +277,28 @@ def rotate(
         manager.update_litellm_database_url()
     else:
         console.print(f"[bold yellow]Rotating credentials for: {service}[/bold yellow]")
-        # Generate just the specified service
-        manager.generate_all()
-        credentials = [c for c in manager.credentials if c.service.lower() == service.lower()]
+        credentials = manager.generate_for(service)
         if not credentials:
             console.print(f"[red]Error:[/red] Unknown service: {service}")
             raise typer.Exit(1)
 
-    for cred in credentials:
-        console.print(f"  [cyan]•[/cyan] {cred.service}: {len(cred.keys)} keys rotated")
+    console.print(
+        "\n".join(
+            f"  [cyan]•[/cyan] {cred.service}: {len(cred.keys)} keys rotated"
+            for cred in credentials
+        )
+    )
 
     if apply and not dry_run:
-        asyncio.run(_apply_secrets(credentials))
+        _run(_apply_secrets(credentials))
 
     # Update credentials document
     if not dry_run:
+        # Keep generate's cache in step with what was rotated. A partial set
+        # (nothing existing to merge into) is not cached, or generate would
+        # reuse it in place of a full one.
+        if manager.covers_all_services():
+            manager.save_cached()
         manager.export_to_markdown(settings.credentials_doc)
         console.print(f"[green]✓[/green] Updated credentials document")
 
@@ -194,25 +323,12 @@ def from_env(
             raise typer.Exit(1)
         env_vars = dotenv_values(env_file)
     else:
-        env_vars = dict(os.environ)
-
-    # Map environment variables to services
-    mappings = {
-        "ARGOCD_ADMIN_PASSWORD": ("argocd", "argocd-initial-admin-secret", "password"),
-        "OPENWEBUI_SECRET_KEY": ("self-hosted-ai", "webui-secret", "secret-key"),
-        "OPENWEBUI_ADMIN_PASSWORD": ("self-hosted-ai", "webui-secret", "admin-password"),
-        "LITELLM_MASTER_KEY": ("self-hosted-ai", "litellm-secret", "master-key"),
-        "POSTGRESQL_PASSWORD": ("self-hosted-ai", "postgresql-secret", "postgres-password"),
-        "REDIS_PASSWORD": ("self-hosted-ai", "redis-secret", "redis-password"),
-        "N8N_ENCRYPTION_KEY": ("automation", "n8n-secret", "N8N_ENCRYPTION_KEY"),
-        "GRAFANA_ADMIN_PASSWORD": ("monitoring", "grafana-secret", "admin-password"),
-    }
-
-    imported = []
-    for env_key, (namespace, secret_name, key) in mappings.items():
-        if env_key in env_vars:
-            imported.append((namespace, secret_name, key, env_vars[env_key]))
-            console.print(f"  [green]✓[/green] Found {env_key}")
+        env_vars = os.environ
+
+    found = sorted(ENV_SECRET_MAPPINGS.keys() & env_vars.keys())
+    imported = [(*ENV_SECRET_MAPPINGS[env_key], env_vars[env_key]) for env_key in found]
+    if found:
+        console.print("\n".join(f"  [green]✓[/green] Found {env_key}" for env_key in found))
 
     if not imported:
         console.print("[yellow]No matching environment variables found.[/yellow]")
@@ -228,6 +344,7 @@ def from_env(
 
 @app.command()
 def export(
+    ctx: typer.Context,
     output: Annotated[
         Path,
         typer.Option("--output", "-o", help="Output file path"),
@@ -238,13 +355,11 @@ def export(
     ] = OutputFormat.MARKDOWN,
 ) -> None:
     """Export current credentials to file."""
-    settings = get_settings()
-
     # Try to read existing secrets from Kubernetes
     console.print("[blue]Reading credentials from Kubernetes...[/blue]")
 
     async def _read_and_export() -> None:
-        manager = SecretsManager(settings)
+        manager = _get_manager(ctx)
         # For now, generate (in real impl, would read from cluster)
         manager.generate_all()
         manager.update_litellm_database_url()
@@ -257,11 +372,16 @@ def export(
             manager.export_to_yaml(output)
             console.print(f"[green]✓[/green] Exported to: {output}")
 
-    asyncio.run(_read_and_export())
+        if format == OutputFormat.JSON:
+            manager.export_to_json(output)
+            console.print(f"[green]✓[/green] Exported to: {output}")
+
+    _run(_read_and_export())
 
 
 @app.command()
 def show(
+    ctx: typer.Context,
     service: Annotated[
         Optional[str],
         typer.Option("--service", "-s", help="Show specific service"),
@@ -272,57 +392,109 @@ def show(
     ] = False,
 ) -> None:
     """Display current credentials (from credentials document)."""
-    settings = get_settings()
-    creds_path = settings.credentials_doc
+    creds_path = ctx.obj.settings.credentials_doc
 
     if not creds_path.exists():
         console.print("[yellow]No credentials document found.[/yellow]")
         console.print("Run [cyan]shai-secrets generate[/cyan] to create one.")
         raise typer.Exit(1)
 
-    content = creds_path.read_text()
-
     if service:
         # Extract specific service section
         console.print(f"[bold]Credentials for: {service}[/bold]")
         # Would parse and display specific service
-    else:
-        if reveal:
-            console.print(content)
-        else:
-            # Mask secrets
-            import re
-
-            masked = re.sub(
-                r'(password|key|secret|token):\s*"([^"]+)"',
-                r'\1: "********"',
-                content,
-                flags=re.IGNORECASE,
-            )
-            console.print(masked)
+        return
+
+    # Stream the document line by line instead of loading and re-rendering it whole
+    out = sys.stdout.buffer
+    with creds_path.open("rb") as f:
+        for line in f:
+            out.write(line if reveal else _mask_line(line))
+    out.flush()
 
 
 async def _apply_secrets(credentials: list) -> None:
-    """Apply credentials to Kubernetes as secrets."""
+    """Apply credentials to Kubernetes as secrets.
+
+    Existing secrets are listed once per namespace, then secrets are
+    applied concurrently (at most 16 API round trips in flight) and the
+    outcome is rendered as a single table. Secrets whose content hash
+    annotation already matches are left untouched. If a namespace cannot
+    be listed, its secrets are written one by one without the hash check.
+    """
+    import asyncio
+
+    from kubernetes_asyncio.client import ApiException
+    from rich.markup import escape
+    from rich.table import Table
+
     from lib.kubernetes import kubernetes_client
 
+    if not credentials:
+        return
+
     console.print("\n[bold blue]Applying secrets to Kubernetes...[/bold blue]")
 
-    async with kubernetes_client() as k8s:
-        for cred in credentials:
+    sem = asyncio.Semaphore(min(16, len(credentials)))
+
+    async def _write(cred, exists: bool) -> None:
+        annotations = {CONTENT_HASH_ANNOTATION: cred.content_hash()}
+        if exists:
+            await k8s.update_secret(
+                cred.secret_name, cred.keys, cred.namespace, annotations=annotations
+            )
+        else:
+            await k8s.create_secret(
+                cred.secret_name, cred.keys, cred.namespace, annotations=annotations
+            )
+
+    async def _list(namespace: str) -> dict[str, dict[str, str]] | None:
+        try:
+            return await k8s.list_secret_annotations(namespace)
+        except Exception as e:
+            detail = f"HTTP {e.status}" if isinstance(e, ApiException) else escape(str(e))
+            console.print(
+                f"[yellow]Could not list secrets in {namespace} ({detail}); "
+                "applying them without the hash check[/yellow]"
+            )
+            return None
+
+    async def _apply_one(cred) -> tuple[str, str, str, str]:
+        async with sem:
+            listing = existing[cred.namespace]
+            current = listing.get(cred.secret_name) if listing is not None else None
+            if current and current.get(CONTENT_HASH_ANNOTATION) == cred.content_hash():
+                return "[dim]= Unchanged[/dim]", cred.namespace, cred.secret_name, ""
+            # Unlisted namespace: try an update; a 404 below falls back to create
+            exists = current is not None if listing is not None else True
             try:
-                if await k8s.secret_exists(cred.secret_name, cred.namespace):
-                    await k8s.update_secret(cred.secret_name, cred.keys, cred.namespace)
-                    console.print(
-                        f"  [yellow]↻[/yellow] Updated: {cred.namespace}/{cred.secret_name}"
-                    )
-                else:
-                    await k8s.create_secret(cred.secret_name, cred.keys, cred.namespace)
-                    console.print(
-                        f"  [green]✓[/green] Created: {cred.namespace}/{cred.secret_name}"
-                    )
+                try:
+                    await _write(cred, exists)
+                except ApiException as e:
+                    # Secret was deleted (404) or created (409) since it was listed
+                    if e.status not in (404, 409):
+                        raise
+                    exists = not exists
+                    await _write(cred, exists)
             except Exception as e:
-                console.print(f"  [red]✗[/red] Failed: {cred.namespace}/{cred.secret_name}: {e}")
+                return "[red]✗ Failed[/red]", cred.namespace, cred.secret_name, escape(str(e))
+            status = "[yellow]↻ Updated[/yellow]" if exists else "[green]✓ Created[/green]"
+            return status, cred.namespace, cred.secret_name, ""
+
+    async with kubernetes_client() as k8s:
+        namespaces = sorted({cred.namespace for cred in credentials})
+        listings = await asyncio.gather(*(_list(ns) for ns in namespaces))
+        existing = dict(zip(namespaces, listings))
+        results = await asyncio.gather(*(_apply_one(cred) for cred in credentials))
+
+    table = Table()
+    table.add_column("Status")
+    table.add_column("Namespace", style="magenta")
+    table.add_column("Secret", style="green")
+    table.add_column("Error", style="red")
+    for row in results:
+        table.add_row(*row)
+    console.print(table)
 
 
 def main() -> None:
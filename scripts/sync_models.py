@@ -4,10 +4,14 @@
 # dependencies = [
 #     "typer>=0.12.0",
 #     "rich>=13.9.0",
-#     "httpx>=0.27.0",
+#     "httpx[http2]>=0.27.0",
 #     "pyyaml>=6.0.0",
 #     "paramiko>=3.4.0",
 #     "huggingface-hub>=0.27.0",
+#     "blake3>=0.4.1",
+#     "xxhash>=3.4.0",
+#     "asyncssh>=2.17.0",
+#     "orjson>=3.10.0",
 # ]
 # [tool.uv]
 # exclude-newer = "2026-01-01"
@@ -63,16 +67,25 @@ Example:
 from __future__ import annotations
 
 import asyncio
+import atexit
 import hashlib
 import json
 import os
+import re
+import shlex
 import subprocess
-from dataclasses import dataclass, field
+import tempfile
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field, replace
 from enum import Enum
+from functools import cache
 from pathlib import Path
-from typing import Annotated, Any
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Annotated, Any
 
-import httpx
+import orjson
 import typer
 import yaml
 from rich.console import Console
@@ -80,6 +93,9 @@ from rich.panel import Panel
 from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
 from rich.table import Table
 
+if TYPE_CHECKING:
+    import httpx
+
 # HuggingFace Hub integration
 try:
     from huggingface_hub import HfApi, login, snapshot_download
@@ -88,6 +104,14 @@ except ImportError:
     HfApi = None
     login = None
 
+# RE2 matches in linear time with a DFA; fall back to the stdlib engine.
+# Deliberately not an inline dependency: google-re2 needs an abseil
+# toolchain wherever no wheel exists.
+try:
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+
 app = typer.Typer(
     name="shai-models",
     help="Synchronize AI models across homelab infrastructure",
@@ -119,7 +143,25 @@ class SyncDirection(str, Enum):
     PULL = "pull"  # Remote → Local
 
 
-@dataclass
+class HashAlgorithm(str, Enum):
+    """Content hash used to verify file models.
+
+    BLAKE3 is cryptographic; xxHash3-128 is not, but is faster still and
+    enough to catch corruption in transit or on disk.
+    """
+
+    BLAKE3 = "blake3"
+    XXH128 = "xxh128"
+
+
+# Remote command printing the hex digest as the first field of its output
+_REMOTE_HASH_COMMANDS = {
+    HashAlgorithm.BLAKE3: "b3sum --no-names",
+    HashAlgorithm.XXH128: "xxh128sum",
+}
+
+
+@dataclass(slots=True, frozen=True)
 class ModelLocation:
     """Represents a location where models can be stored.
 
@@ -149,7 +191,7 @@ class ModelLocation:
         return f"http://{host}:{self.ollama_port}"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ModelInfo:
     """Information about a single model.
 
@@ -170,11 +212,189 @@ class ModelInfo:
     location: str = ""
 
 
+# How long a cached /api/tags snapshot is trusted before re-querying Ollama
+DEFAULT_TAGS_MAX_AGE = 300.0
+
+
+class TagsCache:
+    """On-disk snapshot of Ollama model listings, keyed by host and port.
+
+    Each entry records when it was fetched and a BLAKE2 integrity tag of the
+    raw /api/tags response, so the installed model set can be shown without
+    a network round trip while it is still fresh.
+
+    Attributes:
+        path: JSON file holding all cached entries.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path or Path.home() / ".cache" / "shai-models" / "tags.json"
+
+    def _load(self) -> dict[str, Any]:
+        try:
+            return json.loads(self.path.read_bytes())
+        except (OSError, ValueError):
+            return {}
+
+    def _store(self, entries: dict[str, Any]) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            with tmp_path.open("w") as f:
+                json.dump(entries, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass  # Caching is best-effort
+
+    def get(self, host: str, port: int, max_age_s: float) -> list[ModelInfo] | None:
+        """Return cached models for an Ollama endpoint if younger than max_age_s."""
+        entry = self._load().get(f"{host}:{port}")
+        if not entry or time.time() - entry.get("fetched_at", 0) > max_age_s:
+            return None
+        return [ModelInfo(**{**m, "type": ModelType(m["type"])}) for m in entry["models"]]
+
+    def revalidate(self, host: str, port: int, integrity: str) -> list[ModelInfo] | None:
+        """Renew an entry whose stored integrity tag matches a fresh response.
+
+        Ollama sends no ETag, so a digest of the response body stands in for
+        one: when it is unchanged the cached models are returned (and their
+        age reset) without parsing the response again.
+        """
+        entries = self._load()
+        entry = entries.get(f"{host}:{port}")
+        if not entry or entry.get("integrity") != integrity:
+            return None
+        entry["fetched_at"] = time.time()
+        self._store(entries)
+        return [ModelInfo(**{**m, "type": ModelType(m["type"])}) for m in entry["models"]]
+
+    def put(self, host: str, port: int, models: list[ModelInfo], integrity: str) -> None:
+        """Record the models listed by an Ollama endpoint."""
+        entries = self._load()
+        entries[f"{host}:{port}"] = {
+            "fetched_at": time.time(),
+            "integrity": integrity,
+            "models": [{**asdict(m), "type": m.type.value} for m in models],
+        }
+        self._store(entries)
+
+    def invalidate(self, host: str, port: int) -> None:
+        """Drop the entry for an endpoint whose model set just changed."""
+        entries = self._load()
+        if entries.pop(f"{host}:{port}", None) is not None:
+            self._store(entries)
+
+
+class DigestManifest:
+    """On-disk record of file model digests, taken locally after each push.
+
+    One JSON file per model type maps file names to their size, mtime and
+    a digest for every HashAlgorithm, so a push only rehashes files that
+    changed since the last one. ``verify --hash`` checks copies against
+    the digest for the algorithm it was asked to use.
+
+    Attributes:
+        path: Directory holding the per-type manifests.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path or Path.home() / ".cache" / "shai-models" / "digests"
+
+    def _file(self, model_type: ModelType) -> Path:
+        return self.path / f"{model_type.value}.json"
+
+    def _load(self, model_type: ModelType) -> dict[str, Any]:
+        try:
+            return json.loads(self._file(model_type).read_bytes())
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, model_type: ModelType, name: str, algorithm: HashAlgorithm) -> str | None:
+        """Digest recorded for a file at push time with this algorithm."""
+        return self._load(model_type).get(name, {}).get("digests", {}).get(algorithm.value)
+
+    def record(self, model_type: ModelType, directory: Path) -> None:
+        """Hash the files just pushed from a local directory (blocking).
+
+        Entries whose size and mtime still match are kept without rehashing;
+        files that no longer exist are dropped.
+        """
+        entries = self._load(model_type)
+        current = {}
+        for name, (size, mtime_ns) in _local_file_stats(directory).items():
+            if name.startswith("."):
+                continue
+            entry = entries.get(name)
+            if (
+                not entry
+                or (entry["size"], entry["mtime_ns"]) != (size, mtime_ns)
+                or set(entry.get("digests", ())) != {a.value for a in HashAlgorithm}
+            ):
+                digests = {a.value: _HASHERS[a](directory / name) for a in HashAlgorithm}
+                entry = {"size": size, "mtime_ns": mtime_ns, "digests": digests}
+            current[name] = entry
+        path = self._file(model_type)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(current))
+        os.replace(tmp_path, path)
+
+
+@cache
+def _paths_for(model_type: ModelType) -> tuple[Path, bool] | None:
+    """Map a model type to its subdirectory and whether Ollama manages it.
+
+    Args:
+        model_type: Type of models.
+
+    Returns:
+        Tuple of (subpath under a location's base path, is_ollama), or None
+        for ModelType.ALL, which has no directory of its own.
+    """
+    table = {
+        ModelType.CHECKPOINTS: ("comfyui/checkpoints", False),
+        ModelType.LORAS: ("comfyui/loras", False),
+        ModelType.VAE: ("comfyui/vae", False),
+        ModelType.EMBEDDINGS: ("comfyui/embeddings", False),
+        ModelType.UPSCALE: ("comfyui/upscale_models", False),
+        ModelType.WHISPER: ("whisper", False),
+        ModelType.OLLAMA: ("ollama", True),
+    }
+    if model_type not in table:
+        return None
+    subpath, is_ollama = table[model_type]
+    return Path(subpath), is_ollama
+
+
+# Model types whose files still shrink under rsync's zlib compression.
+# Safetensors/ckpt weights are effectively incompressible, so compressing
+# them only burns CPU on both ends.
+COMPRESSIBLE_TYPES = frozenset({ModelType.WHISPER})
+
+# Files at least this large are copied as CHUNK_STREAMS disjoint byte ranges
+# over separate SSH connections, so a single checkpoint is not limited to one
+# TCP stream and one core running the cipher.
+CHUNK_THRESHOLD = 4 * 1024**3
+CHUNK_STREAMS = 4
+_MIB = 1024 * 1024
+
+
 @dataclass
 class SyncConfig:
     """Configuration for model synchronization.
 
     Loaded from config/models-manifest.yml and environment variables.
+
+    File models move with rsync by default; set transport to "sftp" (or
+    MODELS_TRANSPORT=sftp) to use pipelined SFTP via asyncssh instead.
+
+    Model files change as whole files (a new quant, a new checkpoint), so
+    rsync is told to skip delta computation (--whole-file), write straight
+    into the destination (--inplace, --preallocate) and never checksum
+    unchanged files. The SSH transport uses AES-GCM, which runs on AES-NI,
+    with SSH-level compression off.
     """
 
     local_models_dir: Path = field(
@@ -194,12 +414,30 @@ class SyncConfig:
     )
     rsync_options: list[str] = field(
         default_factory=lambda: [
-            "-avz",
+            "-av",
             "--progress",
-            "--checksum",
             "--human-readable",
+            "--whole-file",
+            "--inplace",
+            "--preallocate",
         ]
     )
+    rsync_ssh: str = "ssh -c aes128-gcm@openssh.com -o Compression=no"
+    transport: str = field(default_factory=lambda: os.environ.get("MODELS_TRANSPORT", "rsync"))
+
+    def rsync_command(self, compress: bool = False) -> list[str]:
+        """Build the base rsync command line.
+
+        Args:
+            compress: Enable rsync compression (only for compressible data).
+
+        Returns:
+            rsync argv without source/destination.
+        """
+        cmd = ["rsync", *self.rsync_options, "-e", self.rsync_ssh]
+        if compress:
+            cmd.append("-z")
+        return cmd
 
 
 class ModelSyncManager:
@@ -218,13 +456,21 @@ class ModelSyncManager:
         locations: Available model storage locations
     """
 
-    def __init__(self, config: SyncConfig | None = None) -> None:
+    def __init__(
+        self,
+        config: SyncConfig | None = None,
+        tags_max_age: float = DEFAULT_TAGS_MAX_AGE,
+    ) -> None:
         """Initialize the model sync manager.
 
         Args:
             config: Sync configuration. Uses defaults from environment if None.
+            tags_max_age: Seconds a cached Ollama listing stays valid (0 to refresh).
         """
         self.config = config or SyncConfig()
+        self.tags_cache = TagsCache()
+        self.digest_manifest = DigestManifest()
+        self.tags_max_age = tags_max_age
 
         # Define standard locations
         self.locations = {
@@ -246,111 +492,166 @@ class ModelSyncManager:
             ),
         }
 
-        # Model type to subdirectory mapping
-        self.type_paths = {
-            ModelType.CHECKPOINTS: "comfyui/checkpoints",
-            ModelType.LORAS: "comfyui/loras",
-            ModelType.VAE: "comfyui/vae",
-            ModelType.EMBEDDINGS: "comfyui/embeddings",
-            ModelType.UPSCALE: "comfyui/upscale_models",
-            ModelType.WHISPER: "whisper",
-            ModelType.OLLAMA: "ollama",
-        }
+        self._client: httpx.AsyncClient | None = None
+        self._gpu_has_b3sum: bool | None = None
+
+        # Metadata commands (listing, existence checks, hashing) share one
+        # authenticated connection per host instead of a handshake each.
+        # %C gives every host its own socket under this process's prefix.
+        self._ssh_ctl = Path(tempfile.gettempdir()) / f"shai-ssh-{os.getpid()}-%C"
+        self._ssh_base = [
+            "ssh",
+            "-o",
+            f"ControlPath={self._ssh_ctl}",
+            "-o",
+            "ControlMaster=auto",
+            "-o",
+            "ControlPersist=60s",
+        ]
+        self._ssh_targets: set[str] = set()
+        atexit.register(self._close_ssh)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared HTTP client for Ollama APIs, created on first use.
+
+        Reusing one pooled client saves a connection setup per request.
+        Call aclose() before the event loop that used it shuts down.
+        httpx is imported here so commands that never touch the network
+        don't pay for it.
+        """
+        if self._client is None:
+            import httpx
+
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=16),
+            )
+        return self._client
+
+    def _ssh(self, location: ModelLocation) -> list[str]:
+        """SSH argv prefix for a location, multiplexed over its master connection."""
+        target = f"{location.user}@{location.host}"
+        self._ssh_targets.add(target)
+        return [*self._ssh_base, target]
+
+    def _close_ssh(self) -> None:
+        """Stop the master connections opened by this manager."""
+        for target in self._ssh_targets:
+            subprocess.run(
+                [*self._ssh_base, "-O", "exit", target], capture_output=True, check=False
+            )
+        self._ssh_targets.clear()
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client, if one was created."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def list_ollama_models(self, location: ModelLocation) -> list[ModelInfo]:
         """List Ollama models at a specific location via API.
 
+        Serves from the on-disk TagsCache while its entry is younger than
+        tags_max_age. After a live query, an unchanged response (same body
+        digest) reuses the cached models instead of being parsed again.
+
         Args:
             location: Where to query for models.
 
         Returns:
             List of ModelInfo for each installed model.
         """
-        try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(f"{location.ollama_url}/api/tags")
-
-                if response.status_code != 200:
-                    return []
+        host = location.host or "localhost"
+        cached = self.tags_cache.get(host, location.ollama_port, self.tags_max_age)
+        if cached is not None:
+            return cached
 
-                data = response.json()
-                models = []
-
-                for model in data.get("models", []):
-                    models.append(
-                        ModelInfo(
-                            name=model.get("name", ""),
-                            type=ModelType.OLLAMA,
-                            size_bytes=model.get("size", 0),
-                            digest=model.get("digest", ""),
-                            modified=model.get("modified_at", ""),
-                            location=location.name,
-                        )
+        try:
+            response = await self.client.get(f"{location.ollama_url}/api/tags")
+
+            if response.status_code != 200:
+                return []
+
+            integrity = f"blake2b-{hashlib.blake2b(response.content, digest_size=16).hexdigest()}"
+            cached = self.tags_cache.revalidate(host, location.ollama_port, integrity)
+            if cached is not None:
+                return cached
+
+            data = orjson.loads(response.content)
+            models = []
+
+            for model in data.get("models", []):
+                models.append(
+                    ModelInfo(
+                        name=model.get("name", ""),
+                        type=ModelType.OLLAMA,
+                        size_bytes=model.get("size", 0),
+                        digest=model.get("digest", ""),
+                        modified=model.get("modified_at", ""),
+                        location=location.name,
                     )
+                )
 
-                return models
+            self.tags_cache.put(host, location.ollama_port, models, integrity)
+            return models
 
         except Exception as e:
             console.print(f"[yellow]Warning:[/yellow] Cannot reach {location.name}: {e}")
             return []
 
     async def list_file_models(
-        self, location: ModelLocation, model_type: ModelType
+        self, location: ModelLocation, model_type: ModelType, need_size: bool = True
     ) -> list[ModelInfo]:
         """List file-based models at a location.
 
         Args:
             location: Where to list models.
             model_type: Type of models to list.
+            need_size: Stat local files for their size. Without it, local
+                listing only reads directory entries and sizes are left at 0.
 
         Returns:
             List of ModelInfo for found models.
         """
-        if model_type == ModelType.OLLAMA or model_type == ModelType.ALL:
+        paths = _paths_for(model_type)
+        if paths is None or paths[1]:
             return []  # Use list_ollama_models instead
 
-        subpath = self.type_paths.get(model_type, "")
-        base_path = location.base_path / subpath
+        base_path = location.base_path / paths[0]
 
         models = []
 
         if location.is_local:
-            # List local files
-            if base_path.exists():
-                for file in base_path.iterdir():
-                    if file.is_file() and not file.name.startswith("."):
-                        stat = file.stat()
-                        models.append(
-                            ModelInfo(
-                                name=file.name,
-                                type=model_type,
-                                size_bytes=stat.st_size,
-                                location=location.name,
+            # List local files; DirEntry answers is_file() from the directory
+            # listing itself, so only the size needs a stat call.
+            if base_path.is_dir():
+                with os.scandir(base_path) as it:
+                    for entry in it:
+                        if entry.is_file(follow_symlinks=False) and not entry.name.startswith("."):
+                            size = entry.stat(follow_symlinks=False).st_size if need_size else 0
+                            models.append(
+                                ModelInfo(
+                                    name=entry.name,
+                                    type=model_type,
+                                    size_bytes=size,
+                                    location=location.name,
+                                )
                             )
-                        )
         else:
             # List remote files via SSH
             try:
-                cmd = [
-                    "ssh",
-                    f"{location.user}@{location.host}",
-                    f"ls -la {base_path} 2>/dev/null || echo ''",
-                ]
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-
-                for line in result.stdout.strip().split("\n"):
-                    parts = line.split()
-                    if len(parts) >= 9 and parts[0][0] != "d":
-                        name = " ".join(parts[8:])
-                        size = int(parts[4]) if parts[4].isdigit() else 0
-                        models.append(
-                            ModelInfo(
-                                name=name,
-                                type=model_type,
-                                size_bytes=size,
-                                location=location.name,
-                            )
+                stats = await self._remote_file_stats(location, base_path)
+                for name, (size, _) in stats.items():
+                    models.append(
+                        ModelInfo(
+                            name=name,
+                            type=model_type,
+                            size_bytes=size,
+                            location=location.name,
                         )
+                    )
 
             except Exception as e:
                 console.print(f"[yellow]Warning:[/yellow] Cannot list {location.name}: {e}")
@@ -362,40 +663,69 @@ class ModelSyncManager:
         model_name: str,
         source: ModelLocation,
         destination: ModelLocation,
+        progress: Progress | None = None,
     ) -> bool:
         """Sync an Ollama model between locations.
 
         For Ollama models, we trigger a pull on the destination.
         The model is downloaded from the Ollama registry, not copied
-        directly between hosts.
+        directly between hosts. The pull is streamed as line-delimited
+        JSON events, so large downloads report progress and are not cut
+        off by a fixed read timeout.
 
         Args:
             model_name: Name of model to sync (e.g., 'qwen2.5-coder:14b')
             source: Source location (used for verification)
             destination: Where to sync the model
+            progress: Live display for download progress.
 
         Returns:
             True if sync succeeded.
         """
+        import httpx
+
+        task = progress.add_task(model_name, total=None) if progress is not None else None
+        status = ""
         try:
-            async with httpx.AsyncClient(timeout=600.0) as client:
-                # Trigger pull on destination
-                response = await client.post(
-                    f"{destination.ollama_url}/api/pull",
-                    json={"name": model_name, "stream": False},
-                )
+            # Trigger pull on destination
+            async with self.client.stream(
+                "POST",
+                f"{destination.ollama_url}/api/pull",
+                json={"name": model_name, "stream": True},
+                timeout=httpx.Timeout(None, connect=30.0),
+            ) as response:
+                if response.status_code != 200:
+                    return False
+
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    event = orjson.loads(line)
+                    if "error" in event:
+                        console.print(f"[red]Error syncing {model_name}:[/red] {event['error']}")
+                        return False
+                    status = event.get("status", status)
+                    if task is not None:
+                        progress.update(
+                            task,
+                            description=f"{model_name}: {status}",
+                            completed=event.get("completed", 0),
+                            total=event.get("total") or None,
+                        )
 
-                return response.status_code == 200
+            self.tags_cache.invalidate(destination.host or "localhost", destination.ollama_port)
+            return status == "success"
 
         except Exception as e:
             console.print(f"[red]Error syncing {model_name}:[/red] {e}")
             return False
 
-    def sync_file_models(
+    async def sync_file_models(
         self,
         model_type: ModelType,
         direction: SyncDirection,
         dry_run: bool = False,
+        progress: Progress | None = None,
     ) -> bool:
         """Sync file-based models using rsync.
 
@@ -406,22 +736,26 @@ class ModelSyncManager:
             model_type: Type of models to sync.
             direction: Push or pull.
             dry_run: If True, show what would be synced without doing it.
+            progress: Live display for per-file transfer progress. Without
+                one, rsync's file list is printed as it arrives.
 
         Returns:
             True if sync succeeded.
         """
-        subpath = self.type_paths.get(model_type, "")
-        if not subpath:
+        paths = _paths_for(model_type)
+        if paths is None:
             return False
 
+        subpath = paths[0]
         local_path = self.config.local_models_dir / subpath
-        remote_path = f"{self.config.gpu_worker_user}@{self.config.gpu_worker_host}:{self.config.remote_models_dir}/{subpath}"
+        remote_dir = self.config.remote_models_dir / subpath
+        remote_path = f"{self.config.gpu_worker_user}@{self.config.gpu_worker_host}:{remote_dir}"
 
         # Ensure local directory exists
         local_path.mkdir(parents=True, exist_ok=True)
 
         # Build rsync command
-        cmd = ["rsync"] + self.config.rsync_options
+        cmd = self.config.rsync_command(compress=model_type in COMPRESSIBLE_TYPES)
 
         if dry_run:
             cmd.append("--dry-run")
@@ -432,62 +766,581 @@ class ModelSyncManager:
             cmd.extend([f"{remote_path}/", str(local_path)])
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            # Huge files go first as parallel byte-range streams; they land with
+            # the source size and mtime, so the rsync pass below skips them.
+            large = await self._files_to_chunk(local_path, remote_dir, direction)
+            for name, (size, mtime_ns) in sorted(large.items()):
+                if dry_run:
+                    console.print(
+                        f"Would copy {name} ({_format_size(size)}) in {CHUNK_STREAMS} chunks"
+                    )
+                    continue
+                if not await self.transfer_large_file(
+                    name, size, mtime_ns, local_path, remote_dir, direction
+                ):
+                    return False
+
+            if self.config.transport == "sftp":
+                ok = await self.sftp_transfer(local_path, remote_dir, direction, dry_run)
+            else:
+                returncode, stderr = await _run_rsync(cmd, progress, model_type.value)
+                ok = returncode == 0
+                if not ok:
+                    console.print(f"[red]rsync error ({model_type.value}):[/red] {stderr}")
 
-            if result.returncode != 0:
-                console.print(f"[red]rsync error:[/red] {result.stderr}")
-                return False
+            if ok and direction == SyncDirection.PUSH and not dry_run:
+                # Record what was pushed for `verify --hash` to check against
+                await asyncio.to_thread(self.digest_manifest.record, model_type, local_path)
+            return ok
+
+        except Exception as e:
+            console.print(f"[red]Sync error ({model_type.value}):[/red] {e}")
+            return False
+
+    async def sftp_transfer(
+        self,
+        local_dir: Path,
+        remote_dir: Path,
+        direction: SyncDirection,
+        dry_run: bool = False,
+    ) -> bool:
+        """Copy changed files in one model directory over pipelined SFTP.
+
+        Keeps up to 128 read/write requests in flight per file instead of
+        waiting on each acknowledgement. Files whose size and mtime (to the
+        second, SFTP's resolution) already match at the destination are
+        skipped, much like rsync's quick check.
+
+        Args:
+            local_dir: Local model directory.
+            remote_dir: Remote model directory on the GPU worker.
+            direction: Push or pull.
+            dry_run: If True, only list the files that would be copied.
+
+        Returns:
+            True if every changed file was copied.
+        """
+        # Imported here so rsync-only runs don't pay for it
+        import asyncssh
 
-            if result.stdout:
-                console.print(result.stdout)
+        local = _local_file_stats(local_dir)
+        remote = await self._remote_file_stats(self.locations["gpu_worker"], remote_dir)
+        source, dest = (local, remote) if direction == SyncDirection.PUSH else (remote, local)
 
+        def _key(stat: tuple[int, int]) -> tuple[int, int]:
+            # SFTP carries whole-second mtimes, so compare at that resolution
+            return stat[0], stat[1] // 1_000_000_000
+
+        names = sorted(
+            name
+            for name, stat in source.items()
+            if not name.startswith(".") and (name not in dest or _key(dest[name]) != _key(stat))
+        )
+        if dry_run or not names:
+            for name in names:
+                console.print(f"Would copy {name}")
             return True
 
-        except Exception as e:
-            console.print(f"[red]Sync error:[/red] {e}")
-            return False
+        options = {"block_size": 256 * 1024, "max_requests": 128, "preserve": True}
+        async with asyncssh.connect(
+            self.config.gpu_worker_host, username=self.config.gpu_worker_user
+        ) as conn, conn.start_sftp_client() as sftp:
+            if direction == SyncDirection.PUSH:
+                await sftp.makedirs(str(remote_dir), exist_ok=True)
+                await sftp.put([str(local_dir / n) for n in names], str(remote_dir), **options)
+            else:
+                await sftp.get([str(remote_dir / n) for n in names], str(local_dir), **options)
+        return True
+
+    async def _files_to_chunk(
+        self, local_dir: Path, remote_dir: Path, direction: SyncDirection
+    ) -> dict[str, tuple[int, int]]:
+        """Find source files above CHUNK_THRESHOLD that differ at the destination.
+
+        Returns nothing when the GPU worker cannot hash chunked copies, so
+        those files fall through to the regular transfer.
+
+        Args:
+            local_dir: Local model directory.
+            remote_dir: Remote model directory on the GPU worker.
+            direction: Push or pull.
+
+        Returns:
+            Mapping of file name to source (size, mtime in nanoseconds).
+        """
+        local = _local_file_stats(local_dir)
+        remote = await self._remote_file_stats(self.locations["gpu_worker"], remote_dir)
+        source, dest = (local, remote) if direction == SyncDirection.PUSH else (remote, local)
+        large = {
+            name: stat
+            for name, stat in source.items()
+            if stat[0] >= CHUNK_THRESHOLD and dest.get(name) != stat
+        }
+        if large and not await self._gpu_can_verify_chunks():
+            return {}
+        return large
+
+    async def _gpu_can_verify_chunks(self) -> bool:
+        """Whether the GPU worker has b3sum to check chunked copies against.
+
+        Probed once per manager. Without it, large files are left to the
+        regular rsync/SFTP pass instead of being copied in chunks.
+        """
+        if self._gpu_has_b3sum is None:
+            proc = await asyncio.create_subprocess_exec(
+                *self._ssh(self.locations["gpu_worker"]),
+                "command -v b3sum",
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            self._gpu_has_b3sum = await proc.wait() == 0
+            if not self._gpu_has_b3sum:
+                console.print(
+                    "[yellow]b3sum not found on the GPU worker; "
+                    "copying large files without chunking[/yellow]"
+                )
+        return self._gpu_has_b3sum
+
+    def _gpu_ssh(self) -> list[str]:
+        """SSH argv prefix for the GPU worker, using the rsync transport options.
+
+        Deliberately not multiplexed: each chunk stream needs its own TCP
+        connection to get past the single-stream throughput limit.
+        """
+        return [
+            *shlex.split(self.config.rsync_ssh),
+            f"{self.config.gpu_worker_user}@{self.config.gpu_worker_host}",
+        ]
 
-    async def verify_model(self, model: ModelInfo, location: ModelLocation) -> bool:
+    async def _remote_file_stats(
+        self, location: ModelLocation, remote_dir: Path
+    ) -> dict[str, tuple[int, int]]:
+        """Stat every regular file in a remote directory with one find call.
+
+        Output is NUL-separated, so names with spaces or newlines survive,
+        and find needs a single stat per entry instead of ls's table.
+
+        Args:
+            location: Remote location to query.
+            remote_dir: Directory on that host.
+
+        Returns:
+            Mapping of file name to (size, mtime in nanoseconds).
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *self._ssh(location),
+            f"find {shlex.quote(str(remote_dir))} -maxdepth 1 -type f "
+            "-printf '%s\\t%T@\\t%f\\0' 2>/dev/null",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        stdout, _ = await proc.communicate()
+
+        stats = {}
+        for entry in stdout.split(b"\0"):
+            if not entry:
+                continue
+            size, mtime, name = entry.split(b"\t", 2)
+            seconds, _, fraction = mtime.decode().partition(".")
+            mtime_ns = int(seconds) * 1_000_000_000 + int(fraction[:9].ljust(9, "0"))
+            stats[os.fsdecode(name)] = (int(size), mtime_ns)
+        return stats
+
+    async def _remote_digest(
+        self,
+        location: ModelLocation,
+        path: Path,
+        algorithm: HashAlgorithm = HashAlgorithm.BLAKE3,
+    ) -> str | None:
+        """Hash a remote file on its host rather than pulling the bytes back.
+
+        Args:
+            location: Remote location holding the file.
+            path: Absolute path of the file on that host.
+            algorithm: Hash to compute (b3sum or xxh128sum must be installed).
+
+        Returns:
+            Digest as "<algorithm>:<hex>", or None if hashing failed.
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *self._ssh(location),
+            f"{_REMOTE_HASH_COMMANDS[algorithm]} {shlex.quote(str(path))}",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        stdout, _ = await proc.communicate()
+        if proc.returncode != 0 or not stdout.strip():
+            return None
+        # *sum tools prefix the line with a backslash when the name needs escaping
+        hex_digest = stdout.split()[0].lstrip(b"\\").decode()
+        return f"{algorithm.value}:{hex_digest}"
+
+    async def transfer_large_file(
+        self,
+        name: str,
+        size: int,
+        mtime_ns: int,
+        local_dir: Path,
+        remote_dir: Path,
+        direction: SyncDirection,
+    ) -> bool:
+        """Copy one huge file as CHUNK_STREAMS parallel byte ranges.
+
+        Each range is read or written remotely by ``dd`` over its own SSH
+        connection and placed locally with positional I/O. Once every range
+        has landed, the file is hashed on both ends with BLAKE3 and the
+        destination gets the source mtime so rsync treats it as up to date.
+        Pulls are written to a temporary file that only replaces the local
+        copy once the digests match. If any range fails, the remaining
+        streams are stopped before the file is closed.
+
+        Args:
+            name: File name within the model directory.
+            size: Source file size in bytes.
+            mtime_ns: Source modification time in nanoseconds.
+            local_dir: Local model directory.
+            remote_dir: Remote model directory on the GPU worker.
+            direction: Push or pull.
+
+        Returns:
+            True if the file was copied and its digests match.
+        """
+        local_file = local_dir / name
+        remote_file = shlex.quote(str(remote_dir / name))
+        total_mib = -(-size // _MIB)
+        chunk_mib = -(-total_mib // CHUNK_STREAMS)
+        ssh = self._gpu_ssh()
+        push = direction == SyncDirection.PUSH
+
+        async def _remote(command: str) -> bool:
+            proc = await asyncio.create_subprocess_exec(*ssh, command)
+            return await proc.wait() == 0
+
+        async def _chunk(fd: int, start_mib: int) -> bool:
+            offset = start_mib * _MIB
+            end = min(size, (start_mib + chunk_mib) * _MIB)
+            if push:
+                proc = await asyncio.create_subprocess_exec(
+                    *ssh,
+                    f"dd of={remote_file} bs=1M seek={start_mib} conv=notrunc status=none",
+                    stdin=asyncio.subprocess.PIPE,
+                )
+            else:
+                proc = await asyncio.create_subprocess_exec(
+                    *ssh,
+                    f"dd if={remote_file} bs=1M skip={start_mib} count={chunk_mib} status=none",
+                    stdout=asyncio.subprocess.PIPE,
+                )
+            try:
+                if push:
+                    while offset < end:
+                        data = os.pread(fd, min(4 * _MIB, end - offset), offset)
+                        proc.stdin.write(data)
+                        await proc.stdin.drain()
+                        offset += len(data)
+                    proc.stdin.close()
+                else:
+                    while data := await proc.stdout.read(4 * _MIB):
+                        os.pwrite(fd, data, offset)
+                        offset += len(data)
+                return await proc.wait() == 0 and offset == end
+            finally:
+                # A failed or cancelled range must not leave its ssh/dd behind.
+                # communicate() drains the pipes so the exit is noticed even
+                # when reading had paused on a full buffer.
+                if proc.returncode is None:
+                    proc.kill()
+                    await proc.communicate()
+
+        console.print(f"Copying {name} ({_format_size(size)}) in {CHUNK_STREAMS} chunks")
+        if push:
+            # Size the destination up front so every range writes into place
+            if not await _remote(
+                f"mkdir -p {shlex.quote(str(remote_dir))} && truncate -s {size} {remote_file}"
+            ):
+                return False
+            target = local_file
+            fd = os.open(target, os.O_RDONLY)
+        else:
+            target = local_dir / f".{name}.{os.getpid()}.part"
+            fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+
+        copied = False
+        try:
+            try:
+                if not push:
+                    os.ftruncate(fd, size)
+                # The task group only exits once every range has finished or
+                # been cancelled, so the descriptor is never closed under one.
+                async with asyncio.TaskGroup() as tg:
+                    tasks = [
+                        tg.create_task(_chunk(fd, start))
+                        for start in range(0, total_mib, chunk_mib)
+                    ]
+            except ExceptionGroup as group:
+                console.print(f"[red]Chunked copy of {name} failed:[/red] {group.exceptions[0]}")
+                return False
+            finally:
+                os.close(fd)
+            if not all(task.result() for task in tasks):
+                console.print(f"[red]Chunked copy of {name} failed[/red]")
+                return False
+
+            local_digest, remote_digest = await asyncio.gather(
+                asyncio.to_thread(_blake3_file, target),
+                self._remote_digest(self.locations["gpu_worker"], remote_dir / name),
+            )
+            if remote_digest is None:
+                console.print(f"[red]Could not hash {name} on the GPU worker[/red]")
+                return False
+            if local_digest != remote_digest:
+                console.print(f"[red]BLAKE3 mismatch after copying {name}[/red]")
+                return False
+
+            if push:
+                seconds, nanos = divmod(mtime_ns, 1_000_000_000)
+                copied = await _remote(f"touch -m -d @{seconds}.{nanos:09d} {remote_file}")
+            else:
+                os.utime(target, ns=(mtime_ns, mtime_ns))
+                os.replace(target, local_file)
+                copied = True
+            return copied
+        finally:
+            if not push and not copied:
+                target.unlink(missing_ok=True)
+
+    async def sync_file_model_types(
+        self,
+        model_types: list[ModelType],
+        direction: SyncDirection,
+        dry_run: bool = False,
+        max_concurrency: int = 4,
+        progress: Progress | None = None,
+    ) -> dict[ModelType, bool]:
+        """Sync several file model types with overlapping rsync transfers.
+
+        Each type is an independent directory, so their transfers run
+        concurrently, capped to avoid saturating the SSH link.
+
+        Args:
+            model_types: Types of models to sync.
+            direction: Push or pull.
+            dry_run: If True, show what would be synced without doing it.
+            max_concurrency: Maximum simultaneous rsync processes.
+            progress: Live display shared by all transfers.
+
+        Returns:
+            Mapping of model type to whether its sync succeeded.
+        """
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def _sync(model_type: ModelType) -> bool:
+            async with sem:
+                return await self.sync_file_models(model_type, direction, dry_run, progress)
+
+        results = await asyncio.gather(*(_sync(t) for t in model_types))
+        return dict(zip(model_types, results))
+
+    async def verify_model(
+        self,
+        model: ModelInfo,
+        location: ModelLocation,
+        verify_hash: bool = False,
+        algorithm: HashAlgorithm = HashAlgorithm.BLAKE3,
+    ) -> tuple[ModelInfo, bool | None]:
         """Verify model integrity at a location.
 
-        For Ollama models, checks the API for model availability.
-        For file models, verifies the file exists and size matches.
+        For Ollama models, checks the API for model availability; their
+        sha256 digests come with the listing, so nothing is rehashed.
+        For file models, verifies the file exists and, with verify_hash,
+        computes its digest (locally, or with b3sum/xxh128sum on remote
+        hosts) and compares it with the digest recorded when the file was
+        last pushed. The returned model carries the computed digest.
 
         Args:
             model: Model to verify.
             location: Location to check.
+            verify_hash: Also hash the file contents.
+            algorithm: Hash to use with verify_hash.
 
         Returns:
-            True if model is valid and accessible.
+            Tuple of (model, valid), where valid is True if the model is
+            intact and accessible, or None if it was hashed but no digest
+            was recorded for it to compare against.
         """
         if model.type == ModelType.OLLAMA:
             models = await self.list_ollama_models(location)
-            return any(m.name == model.name for m in models)
+            return model, any(m.name == model.name for m in models)
+
+        # File-based verification
+        full_path = location.base_path / _paths_for(model.type)[0] / model.name
+
+        if location.is_local:
+            if not full_path.is_file():
+                return model, False
+            if not verify_hash:
+                return model, True
+            digest = await asyncio.to_thread(_HASHERS[algorithm], full_path)
+        elif not verify_hash:
+            # Remote check via SSH
+            proc = await asyncio.create_subprocess_exec(
+                *self._ssh(location),
+                f"test -f {shlex.quote(str(full_path))}",
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            try:
+                return model, await asyncio.wait_for(proc.wait(), timeout=10) == 0
+            except TimeoutError:
+                proc.kill()
+                return model, False
         else:
-            # File-based verification
-            subpath = self.type_paths.get(model.type, "")
-            full_path = location.base_path / subpath / model.name
+            digest = await self._remote_digest(location, full_path, algorithm)
+            if digest is None:
+                return model, False
+
+        recorded = self.digest_manifest.get(model.type, model.name, algorithm)
+        model = replace(model, digest=digest)
+        if recorded is None:
+            return model, None
+        return model, recorded == digest
 
-            if location.is_local:
-                return full_path.exists()
-            else:
-                # Remote check via SSH
-                cmd = [
-                    "ssh",
-                    f"{location.user}@{location.host}",
-                    f"test -f {full_path} && echo 'exists'",
-                ]
-                result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-                return "exists" in result.stdout
+
+# Transfer size and percentage at the start of an rsync --progress line,
+# e.g. "  1.23G  45%   98.76MB/s    0:00:12" or "  1,234,567  45% ..."
+_RSYNC_PROGRESS_RE = _re_engine.compile(rb"\s*([\d,.]+[kMGT]?)\s+(\d+)%")
+
+
+async def _run_rsync(
+    cmd: list[str], progress: Progress | None = None, label: str = "rsync"
+) -> tuple[int, str]:
+    """Run rsync, streaming its output instead of buffering all of it.
+
+    rsync redraws --progress lines with carriage returns, so output is split
+    on both CR and LF. Progress lines update a task on the given display;
+    other lines (file names, summary) become its description, or are printed
+    when there is no display. stderr is drained concurrently so neither pipe
+    can fill up and stall the transfer.
+
+    Args:
+        cmd: Full rsync argv.
+        progress: Live display to report per-file progress on.
+        label: Task label, e.g. the model type being synced.
+
+    Returns:
+        Tuple of (return code, stderr text).
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    task = progress.add_task(label, total=100) if progress is not None else None
+
+    def _handle(line: bytes) -> None:
+        if not line.strip():
+            return
+        match = _RSYNC_PROGRESS_RE.match(line)
+        if progress is None or task is None:
+            if not match:
+                console.print(line.decode(errors="replace"), markup=False, highlight=False)
+        elif match:
+            progress.update(task, completed=int(match.group(2)))
+        else:
+            text = line.decode(errors="replace").strip()
+            progress.update(task, description=f"{label}: {text}", completed=0)
+
+    async def _read_stdout() -> None:
+        pending = b""
+        while chunk := await proc.stdout.read(64 * 1024):
+            *lines, pending = re.split(rb"[\r\n]", pending + chunk)
+            for line in lines:
+                _handle(line)
+        _handle(pending)
+
+    _, stderr = await asyncio.gather(_read_stdout(), proc.stderr.read())
+    returncode = await proc.wait()
+    if task is not None:
+        progress.update(task, description=label, completed=100 if returncode == 0 else 0)
+    return returncode, stderr.decode(errors="replace")
+
+
+# Files up to this size are hashed from a single read() on one descriptor;
+# a memory map or a worker pool costs more than it saves below this.
+_SMALL_FILE = _MIB
+
+
+def _read_small(path: Path) -> bytes | None:
+    """Read a file in one call if it is at most _SMALL_FILE bytes, else None."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        return os.read(fd, size) if size <= _SMALL_FILE else None
+    finally:
+        os.close(fd)
+
+
+def _blake3_file(path: Path) -> str:
+    """Hash a local file with BLAKE3 using all cores over a memory map."""
+    import blake3
+
+    data = _read_small(path)
+    if data is not None:
+        return f"blake3:{blake3.blake3(data).hexdigest()}"
+    hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+    hasher.update_mmap(path)
+    return f"blake3:{hasher.hexdigest()}"
+
+
+def _xxh128_file(path: Path) -> str:
+    """Hash a local file with xxHash3-128, streaming it through a reused buffer."""
+    import xxhash
+
+    hasher = xxhash.xxh3_128()
+    with path.open("rb", buffering=0) as f:
+        fd = f.fileno()
+        if os.fstat(fd).st_size <= _SMALL_FILE:
+            hasher.update(f.read())
+            return f"xxh128:{hasher.hexdigest()}"
+        if hasattr(os, "posix_fadvise"):
+            # Let the kernel read ahead aggressively for the sequential scan
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        buf = bytearray(8 * _MIB)
+        view = memoryview(buf)
+        while n := f.readinto(buf):
+            hasher.update(view[:n])
+    return f"xxh128:{hasher.hexdigest()}"
+
+
+_HASHERS = {
+    HashAlgorithm.BLAKE3: _blake3_file,
+    HashAlgorithm.XXH128: _xxh128_file,
+}
+
+
+def _local_file_stats(path: Path) -> dict[str, tuple[int, int]]:
+    """Map each regular file in a local directory to (size, mtime in nanoseconds)."""
+    if not path.is_dir():
+        return {}
+    stats = {}
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_file(follow_symlinks=False):
+                st = entry.stat(follow_symlinks=False)
+                stats[entry.name] = (st.st_size, st.st_mtime_ns)
+    return stats
+
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
 
 
 def _format_size(size_bytes: int) -> str:
     """Format byte size as human-readable string."""
-    for unit in ["B", "KB", "MB", "GB"]:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes //= 1024
-    return f"{size_bytes:.1f} TB"
+    if size_bytes <= 0:
+        return "0.0 B"
+    # bit_length gives the power of 1024 directly instead of dividing in a loop
+    i = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * i)):.1f} {_SIZE_UNITS[i]}"
 
 
 # =============================================================================
@@ -495,8 +1348,33 @@ def _format_size(size_bytes: int) -> str:
 # =============================================================================
 
 
+@app.callback()
+def _root(ctx: typer.Context) -> None:
+    """Share one event loop runner across the invoked command."""
+    runner = asyncio.Runner()
+    ctx.call_on_close(runner.close)
+    ctx.obj = SimpleNamespace(runner=runner)
+
+
+@contextmanager
+def _transfer_progress(dry_run: bool) -> Iterator[Progress | None]:
+    """Live per-transfer progress bars, or None for dry runs so file lists print."""
+    if dry_run:
+        yield None
+        return
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+        console=console,
+    ) as progress:
+        yield progress
+
+
 @app.command("list")
 def list_models(
+    ctx: typer.Context,
     model_type: Annotated[
         ModelType,
         typer.Argument(help="Type of models to list"),
@@ -507,6 +1385,10 @@ def list_models(
             "--location", "-l", help="Location to query (local, gpu_worker, cluster, all)"
         ),
     ] = "all",
+    refresh: Annotated[
+        bool,
+        typer.Option("--refresh", help="Bypass the cached Ollama model listings"),
+    ] = False,
 ) -> None:
     """List available models across locations.
 
@@ -515,22 +1397,26 @@ def list_models(
     """
     console.print(Panel("[bold blue]Model Inventory[/bold blue]"))
 
-    manager = ModelSyncManager()
+    manager = ModelSyncManager(tags_max_age=0 if refresh else DEFAULT_TAGS_MAX_AGE)
 
     async def _list() -> dict[str, list[ModelInfo]]:
-        results: dict[str, list[ModelInfo]] = {}
-
         locations_to_check = (
             [manager.locations[location]] if location != "all" else list(manager.locations.values())
         )
 
-        for loc in locations_to_check:
+        try:
             if model_type == ModelType.OLLAMA or model_type == ModelType.ALL:
-                results[loc.name] = await manager.list_ollama_models(loc)
+                results = await asyncio.gather(
+                    *(manager.list_ollama_models(loc) for loc in locations_to_check)
+                )
             else:
-                results[loc.name] = await manager.list_file_models(loc, model_type)
+                results = await asyncio.gather(
+                    *(manager.list_file_models(loc, model_type) for loc in locations_to_check)
+                )
+        finally:
+            await manager.aclose()
 
-        return results
+        return {loc.name: models for loc, models in zip(locations_to_check, results)}
 
     with Progress(
         SpinnerColumn(),
@@ -538,7 +1424,7 @@ def list_models(
         console=console,
     ) as progress:
         task = progress.add_task("Querying locations...", total=1)
-        all_models = asyncio.run(_list())
+        all_models = ctx.obj.runner.run(_list())
         progress.update(task, completed=1)
 
     # Display results by location
@@ -561,6 +1447,7 @@ def list_models(
 
 @app.command()
 def push(
+    ctx: typer.Context,
     model_type: Annotated[
         ModelType,
         typer.Argument(help="Type of models to push"),
@@ -573,6 +1460,10 @@ def push(
         bool,
         typer.Option("--dry-run", "-n", help="Show what would be transferred"),
     ] = False,
+    sftp: Annotated[
+        bool,
+        typer.Option("--sftp", help="Transfer file models over pipelined SFTP instead of rsync"),
+    ] = False,
 ) -> None:
     """Push models from local to GPU worker.
 
@@ -582,20 +1473,25 @@ def push(
     """
     console.print(Panel("[bold blue]Push Models → GPU Worker[/bold blue]"))
 
-    manager = ModelSyncManager()
+    manager = ModelSyncManager(SyncConfig(transport="sftp") if sftp else None)
 
     if model_type == ModelType.OLLAMA and model_name:
         # Push specific Ollama model
         console.print(f"Pushing Ollama model: {model_name}")
 
-        async def _push_ollama():
-            return await manager.sync_ollama_model(
-                model_name,
-                manager.locations["local"],
-                manager.locations["gpu_worker"],
-            )
+        async def _push_ollama(progress: Progress | None):
+            try:
+                return await manager.sync_ollama_model(
+                    model_name,
+                    manager.locations["local"],
+                    manager.locations["gpu_worker"],
+                    progress,
+                )
+            finally:
+                await manager.aclose()
 
-        success = asyncio.run(_push_ollama())
+        with _transfer_progress(dry_run=False) as progress:
+            success = ctx.obj.runner.run(_push_ollama(progress))
 
         if success:
             console.print(f"[green]✓[/green] Pushed {model_name}")
@@ -617,10 +1513,15 @@ def push(
             ]
         )
 
-        for mtype in types_to_push:
-            console.print(f"\n[bold]Syncing {mtype.value}...[/bold]")
-            success = manager.sync_file_models(mtype, SyncDirection.PUSH, dry_run)
+        console.print(f"\n[bold]Syncing {', '.join(t.value for t in types_to_push)}...[/bold]")
+        with _transfer_progress(dry_run) as progress:
+            results = ctx.obj.runner.run(
+                manager.sync_file_model_types(
+                    types_to_push, SyncDirection.PUSH, dry_run, progress=progress
+                )
+            )
 
+        for mtype, success in results.items():
             if success:
                 console.print(f"[green]✓[/green] {mtype.value} synced")
             else:
@@ -629,6 +1530,7 @@ def push(
 
 @app.command()
 def pull(
+    ctx: typer.Context,
     model_type: Annotated[
         ModelType,
         typer.Argument(help="Type of models to pull"),
@@ -641,6 +1543,10 @@ def pull(
         bool,
         typer.Option("--dry-run", "-n", help="Show what would be transferred"),
     ] = False,
+    sftp: Annotated[
+        bool,
+        typer.Option("--sftp", help="Transfer file models over pipelined SFTP instead of rsync"),
+    ] = False,
 ) -> None:
     """Pull models from GPU worker to local.
 
@@ -649,7 +1555,7 @@ def pull(
     """
     console.print(Panel("[bold blue]Pull Models ← GPU Worker[/bold blue]"))
 
-    manager = ModelSyncManager()
+    manager = ModelSyncManager(SyncConfig(transport="sftp") if sftp else None)
 
     if model_type == ModelType.OLLAMA:
         console.print(
@@ -671,10 +1577,15 @@ def pull(
         ]
     )
 
-    for mtype in types_to_pull:
-        console.print(f"\n[bold]Pulling {mtype.value}...[/bold]")
-        success = manager.sync_file_models(mtype, SyncDirection.PULL, dry_run)
+    console.print(f"\n[bold]Pulling {', '.join(t.value for t in types_to_pull)}...[/bold]")
+    with _transfer_progress(dry_run) as progress:
+        results = ctx.obj.runner.run(
+            manager.sync_file_model_types(
+                types_to_pull, SyncDirection.PULL, dry_run, progress=progress
+            )
+        )
 
+    for mtype, success in results.items():
         if success:
             console.print(f"[green]✓[/green] {mtype.value} pulled")
         else:
@@ -683,10 +1594,15 @@ def pull(
 
 @app.command()
 def diff(
+    ctx: typer.Context,
     model_type: Annotated[
         ModelType,
         typer.Argument(help="Type of models to compare"),
     ] = ModelType.OLLAMA,
+    refresh: Annotated[
+        bool,
+        typer.Option("--refresh", help="Bypass the cached Ollama model listings"),
+    ] = False,
 ) -> None:
     """Compare models between local and GPU worker.
 
@@ -695,12 +1611,16 @@ def diff(
     """
     console.print(Panel("[bold blue]Model Diff: Local ↔ GPU Worker[/bold blue]"))
 
-    manager = ModelSyncManager()
+    manager = ModelSyncManager(tags_max_age=0 if refresh else DEFAULT_TAGS_MAX_AGE)
 
     async def _diff():
-        local_models = await manager.list_ollama_models(manager.locations["local"])
-        remote_models = await manager.list_ollama_models(manager.locations["gpu_worker"])
-        return local_models, remote_models
+        try:
+            return await asyncio.gather(
+                manager.list_ollama_models(manager.locations["local"]),
+                manager.list_ollama_models(manager.locations["gpu_worker"]),
+            )
+        finally:
+            await manager.aclose()
 
     with Progress(
         SpinnerColumn(),
@@ -708,7 +1628,7 @@ def diff(
         console=console,
     ) as progress:
         task = progress.add_task("Comparing...", total=1)
-        local, remote = asyncio.run(_diff())
+        local, remote = ctx.obj.runner.run(_diff())
         progress.update(task, completed=1)
 
     local_names = {m.name for m in local}
@@ -737,19 +1657,38 @@ def diff(
 
 @app.command()
 def verify(
+    ctx: typer.Context,
+    model_type: Annotated[
+        ModelType,
+        typer.Argument(help="Type of models to verify"),
+    ] = ModelType.OLLAMA,
     location: Annotated[
         str,
         typer.Option("--location", "-l", help="Location to verify"),
     ] = "gpu_worker",
+    verify_hash: Annotated[
+        bool,
+        typer.Option("--hash", help="Check file model digests against those recorded on push"),
+    ] = False,
+    algorithm: Annotated[
+        HashAlgorithm,
+        typer.Option("--algorithm", "-a", help="Hash algorithm for --hash"),
+    ] = HashAlgorithm.BLAKE3,
+    refresh: Annotated[
+        bool,
+        typer.Option("--refresh", help="Bypass the cached Ollama model listings"),
+    ] = False,
 ) -> None:
     """Verify model integrity at a location.
 
     Checks that all expected models are accessible and responding.
-    Reports any models that are missing or corrupted.
+    Reports any models that are missing or corrupted. With --hash, file
+    models are compared with the digests recorded by the last push from
+    this machine; files it never pushed are listed as not recorded.
     """
     console.print(Panel(f"[bold blue]Verifying Models at {location}[/bold blue]"))
 
-    manager = ModelSyncManager()
+    manager = ModelSyncManager(tags_max_age=0 if refresh else DEFAULT_TAGS_MAX_AGE)
     loc = manager.locations.get(location)
 
     if not loc:
@@ -757,12 +1696,23 @@ def verify(
         raise typer.Exit(1)
 
     async def _verify():
-        models = await manager.list_ollama_models(loc)
-        results = []
-        for model in models:
-            valid = await manager.verify_model(model, loc)
-            results.append((model, valid))
-        return results
+        try:
+            if model_type in (ModelType.OLLAMA, ModelType.ALL):
+                # One listing answers availability for every Ollama model
+                models = await manager.list_ollama_models(loc)
+                tag_set = {m.name for m in models}
+                return [(m, m.name in tag_set) for m in models]
+
+            models = await manager.list_file_models(loc, model_type, need_size=False)
+            sem = asyncio.Semaphore(8)
+
+            async def _check(model: ModelInfo) -> tuple[ModelInfo, bool | None]:
+                async with sem:
+                    return await manager.verify_model(model, loc, verify_hash, algorithm)
+
+            return await asyncio.gather(*(_check(m) for m in models))
+        finally:
+            await manager.aclose()
 
     with Progress(
         SpinnerColumn(),
@@ -770,19 +1720,24 @@ def verify(
         console=console,
     ) as progress:
         task = progress.add_task("Verifying...", total=1)
-        results = asyncio.run(_verify())
+        results = ctx.obj.runner.run(_verify())
         progress.update(task, completed=1)
 
     table = Table(title="Verification Results")
     table.add_column("Model")
     table.add_column("Status")
+    table.add_column("Digest", max_width=24)
 
     all_valid = True
     for model, valid in results:
-        status = "[green]✓ Valid[/green]" if valid else "[red]✗ Invalid[/red]"
-        table.add_row(model.name, status)
-        if not valid:
+        if valid is None:
+            status = "[yellow]? Not recorded[/yellow]"
+        elif valid:
+            status = "[green]✓ Valid[/green]"
+        else:
+            status = "[red]✗ Invalid[/red]"
             all_valid = False
+        table.add_row(model.name, status, model.digest or "-")
 
     console.print(table)
 
@@ -870,6 +1825,7 @@ def download_huggingface(
 
 @app.command("sync-hf")
 def sync_huggingface_to_gpu(
+    ctx: typer.Context,
     model_name: Annotated[
         str,
         typer.Argument(help="Local model name or HuggingFace repo ID"),
@@ -910,7 +1866,7 @@ def sync_huggingface_to_gpu(
     config = SyncConfig()
     remote_path = f"{config.gpu_worker_user}@{config.gpu_worker_host}:{remote_dir}/{model_name}"
 
-    cmd = ["rsync"] + config.rsync_options
+    cmd = config.rsync_command()
 
     if dry_run:
         cmd.append("--dry-run")
@@ -918,13 +1874,13 @@ def sync_huggingface_to_gpu(
     cmd.extend([f"{source_path}/", remote_path])
 
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        with _transfer_progress(dry_run) as progress:
+            returncode, stderr = ctx.obj.runner.run(_run_rsync(cmd, progress, model_name))
 
-        if result.returncode != 0:
-            console.print(f"[red]rsync error:[/red] {result.stderr}")
+        if returncode != 0:
+            console.print(f"[red]rsync error:[/red] {stderr}")
             raise typer.Exit(1)
 
-        console.print(result.stdout)
         console.print(f"[green]✓[/green] Model synced to GPU worker")
 
     except Exception as e:
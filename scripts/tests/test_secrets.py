@@ -0,0 +1,72 @@
+"""Tests for credential generation and rotation."""
+
+from __future__ import annotations
+
+import pytest
+from typer.testing import CliRunner
+
+import secrets_manager
+from lib.config import Settings
+from lib.secrets import SecretsManager
+
+
+@pytest.fixture
+def settings(tmp_path):
+    return Settings(project_root=tmp_path, secrets_dir=tmp_path / "secrets")
+
+
+@pytest.fixture
+def generated(settings):
+    """Credentials for every service, cached and exported like ``generate``."""
+    manager = SecretsManager(settings)
+    manager.generate_all()
+    manager.update_litellm_database_url()
+    manager.save_cached()
+    manager.export_to_markdown(settings.credentials_doc)
+    return {cred.service: cred for cred in manager.credentials}
+
+
+def _cli(settings, monkeypatch, *args):
+    monkeypatch.setattr(secrets_manager, "get_settings", lambda: settings)
+    result = CliRunner().invoke(secrets_manager.app, list(args))
+    assert result.exit_code == 0, result.output
+
+
+@pytest.mark.parametrize("keep_cache", [True, False], ids=["cache", "document-only"])
+def test_rotate_service_keeps_other_services(settings, generated, monkeypatch, keep_cache):
+    if not keep_cache:
+        SecretsManager(settings).clear_cached()
+
+    _cli(settings, monkeypatch, "rotate", "--service", "redis")
+
+    exported = SecretsManager(settings).load_document(settings.credentials_doc)
+    assert exported is not None
+    by_service = {cred.service: cred for cred in exported}
+    assert list(by_service) == list(generated)
+    assert by_service["Redis"].keys != generated["Redis"].keys
+    for service, cred in generated.items():
+        if service != "Redis":
+            assert by_service[service].keys == cred.keys
+
+
+def test_rotate_service_updates_cache_entry(settings, generated, monkeypatch):
+    _cli(settings, monkeypatch, "rotate", "--service", "redis")
+
+    cached = SecretsManager(settings).load_cached()
+    assert cached is not None
+    by_service = {cred.service: cred for cred in cached}
+    exported = SecretsManager(settings).load_document(settings.credentials_doc)
+    assert by_service == {cred.service: cred for cred in exported}
+    assert by_service["Redis"].keys != generated["Redis"].keys
+    assert by_service["Grafana"].keys == generated["Grafana"].keys
+
+
+@pytest.mark.usefixtures("generated")
+@pytest.mark.parametrize("fmt", ["json", "yaml"])
+def test_generate_format_keeps_markdown_document(settings, monkeypatch, fmt):
+    document = settings.credentials_doc.read_text()
+
+    _cli(settings, monkeypatch, "generate", "--format", fmt)
+
+    assert settings.credentials_doc.read_text() == document
+    assert settings.credentials_doc.with_suffix(f".{fmt}").is_file()
@@ -7,32 +7,95 @@ and updates INDEX.md token estimates accordingly.
 """
 
 import hashlib
+import heapq
+import json
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Doc claim heading in INDEX.md: "#### [NAME.md](path) (1,234 tokens)"
+_CLAIM_RE = re.compile(r"####\s+\[([\w\-\.]+\.md)\]\(([^)]+)\)\s+\(([0-9,]+)\s+tokens\)")
 
 
 def compute_file_hash(file_path: Path) -> str:
     """Compute SHA-256 hash of file content."""
     if not file_path.exists():
         return ""
-    return hashlib.sha256(file_path.read_bytes()).hexdigest()
+    with file_path.open("rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        # Python < 3.11: stream in 1 MiB chunks
+        digest = hashlib.sha256()
+        while chunk := f.read(1 << 20):
+            digest.update(chunk)
+        return digest.hexdigest()
 
 
-def estimate_tokens(text: str) -> int:
-    """Estimate token count (1.3 tokens per word for documentation)."""
-    words = len(text.split())
+def estimate_tokens(data: bytes) -> int:
+    """
+    Estimate token count (1.3 tokens per word for documentation).
+
+    Works on raw bytes so docs are never decoded; words are split on
+    ASCII whitespace.
+    """
+    words = len(data.split())
     return int(words * 1.3)
 
 
+def _entry_hash(entry: Any) -> str:
+    """Content hash of a manifest entry (older manifests stored bare hashes)."""
+    return entry.get("hash", "") if isinstance(entry, dict) else entry
+
+
+def _doc_tokens(
+    full_path: Path,
+    project_root: Path,
+    old_manifest: Dict[str, Any],
+    new_manifest: Dict[str, Dict[str, Any]],
+) -> int:
+    """
+    Token estimate for a doc, reusing the previous count when its hash is unchanged.
+
+    Fresh counts are recorded on the doc's new manifest entry so the next
+    run can skip reading it.
+    """
+    try:
+        key = str(full_path.relative_to(project_root))
+    except ValueError:
+        key = ""
+    entry = new_manifest.get(key)
+    old_entry = old_manifest.get(key)
+
+    if (
+        entry is not None
+        and isinstance(old_entry, dict)
+        and "tokens" in old_entry
+        and old_entry.get("hash") == entry["hash"]
+    ):
+        tokens = old_entry["tokens"]
+    else:
+        tokens = estimate_tokens(full_path.read_bytes())
+
+    if entry is not None:
+        entry["tokens"] = tokens
+    return tokens
+
+
 def extract_doc_claims(index_content: str) -> List[Tuple[str, str, int]]:
     """
     Extract doc claims from INDEX.md.
 
     Returns list of (filename, path, claimed_tokens)
     """
-    pattern = r"####\s+\[([\w\-\.]+\.md)\]\(([^)]+)\)\s+\(([0-9,]+)\s+tokens\)"
-    matches = re.finditer(pattern, index_content)
+    matches = _CLAIM_RE.finditer(index_content)
 
     claims = []
     for match in matches:
@@ -44,8 +107,18 @@ def extract_doc_claims(index_content: str) -> List[Tuple[str, str, int]]:
     return claims
 
 
+def _rewrite_claim(match: re.Match, updates_map: Dict[Tuple[str, str], int]) -> str:
+    """Return a claim heading with its token count replaced if it has an update."""
+    new_tokens = updates_map.get((match.group(1), match.group(2)))
+    if new_tokens is None:
+        return match.group(0)
+    start, end = match.start(3) - match.start(), match.end(3) - match.start()
+    return f"{match.group(0)[:start]}{new_tokens:,}{match.group(0)[end:]}"
+
+
+@lru_cache(maxsize=None)
 def resolve_doc_path(relative_path: str, project_root: Path) -> Path:
-    """Resolve relative path to absolute path."""
+    """Resolve relative path to absolute path (memoized; claims repeat paths)."""
     candidates = [
         project_root / relative_path,
         project_root / "docs" / relative_path,
@@ -59,7 +132,13 @@ def resolve_doc_path(relative_path: str, project_root: Path) -> Path:
     return candidates[0]
 
 
-def update_token_counts(index_path: Path, project_root: Path, threshold: float = 0.20) -> int:
+def update_token_counts(
+    index_path: Path,
+    project_root: Path,
+    threshold: float = 0.20,
+    old_manifest: Optional[Dict[str, Any]] = None,
+    new_manifest: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> int:
     """
     Update token counts in INDEX.md if variance > threshold.
 
@@ -67,6 +146,9 @@ def update_token_counts(index_path: Path, project_root: Path, threshold: float =
         index_path: Path to INDEX.md
         project_root: Project root directory
         threshold: Variance threshold (default 20%)
+        old_manifest: Previous hash manifest; docs whose hash is unchanged
+            reuse its token counts instead of being re-read
+        new_manifest: Current hash manifest; receives the token counts
 
     Returns:
         Number of token counts updated
@@ -82,6 +164,7 @@ def update_token_counts(index_path: Path, project_root: Path, threshold: float =
     claims = extract_doc_claims(index_content)
 
     updates = 0
+    updates_map: Dict[Tuple[str, str], int] = {}
     print(f"📋 Checking {len(claims)} documents for token count updates...\n")
 
     for filename, path, claimed_tokens in claims:
@@ -93,19 +176,14 @@ def update_token_counts(index_path: Path, project_root: Path, threshold: float =
             continue
 
         # Calculate actual tokens
-        actual_tokens = estimate_tokens(full_path.read_text())
+        actual_tokens = _doc_tokens(full_path, project_root, old_manifest or {}, new_manifest or {})
 
         # Calculate variance
         variance = abs(actual_tokens - claimed_tokens) / claimed_tokens if claimed_tokens else 1.0
 
         if variance > threshold:
-            # Update token count in INDEX
-            old_pattern = (
-                rf"(\[{re.escape(filename)}\]\({re.escape(path)}\)\s+\()([0-9,]+)(\s+tokens\))"
-            )
-            new_value = f"\\g<1>{actual_tokens:,}\\g<3>"
-
-            index_content = re.sub(old_pattern, new_value, index_content)
+            # Queue the update; all claims are rewritten in one pass below
+            updates_map[(filename, path)] = actual_tokens
 
             print(f"🔄 {filename}:")
             print(f"   Claimed: {claimed_tokens:,} → Actual: {actual_tokens:,}")
@@ -119,6 +197,7 @@ def update_token_counts(index_path: Path, project_root: Path, threshold: float =
 
     # Write back if changes made
     if updates > 0:
+        index_content = _CLAIM_RE.sub(lambda m: _rewrite_claim(m, updates_map), index_content)
         index_path.write_text(index_content)
         print(f"\n💾 Updated INDEX.md with {updates} token count corrections")
     else:
@@ -127,53 +206,69 @@ def update_token_counts(index_path: Path, project_root: Path, threshold: float =
     return updates
 
 
-def generate_hash_manifest(project_root: Path) -> Dict[str, str]:
+def generate_hash_manifest(project_root: Path) -> Dict[str, Dict[str, Any]]:
     """
     Generate content hash manifest for all docs.
 
-    Returns dict of {filepath: hash}
+    Returns dict of {filepath: {"hash": hash}}; update_token_counts adds
+    "tokens" to the entries of docs claimed in INDEX.md.
     """
-    manifest = {}
     docs_dir = project_root / "docs"
+    doc_paths = list(docs_dir.rglob("*.md"))
 
-    for doc_path in docs_dir.rglob("*.md"):
-        relative_path = doc_path.relative_to(project_root)
-        content_hash = compute_file_hash(doc_path)
-        manifest[str(relative_path)] = content_hash
-
-    return manifest
+    # Hashing releases the GIL, so threads overlap reads with digesting
+    workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        hashes = pool.map(compute_file_hash, doc_paths)
+        return {
+            str(doc_path.relative_to(project_root)): {"hash": content_hash}
+            for doc_path, content_hash in zip(doc_paths, hashes)
+        }
 
 
-def save_hash_manifest(manifest: Dict[str, str], output_path: Path):
+def save_hash_manifest(manifest: Dict[str, Dict[str, Any]], output_path: Path):
     """Save hash manifest to file."""
-    import json
+    if orjson is not None:
+        output_path.write_bytes(
+            orjson.dumps(manifest, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        )
+    else:
+        output_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
 
-    output_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+
+def load_hash_manifest(manifest_path: Path) -> Dict[str, Any]:
+    """Load a hash manifest saved by save_hash_manifest."""
+    data = manifest_path.read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
 
 
 def compare_manifests(
-    old_manifest: Dict[str, str], new_manifest: Dict[str, str]
-) -> Dict[str, List[str]]:
+    old_manifest: Dict[str, Any], new_manifest: Dict[str, Any]
+) -> Dict[str, Set[str]]:
     """
     Compare two hash manifests.
 
-    Returns dict with:
+    Returns dict of unordered sets with:
     - added: Files added
     - removed: Files removed
     - changed: Files with changed content
     """
-    old_files = set(old_manifest.keys())
-    new_files = set(new_manifest.keys())
+    old_files = old_manifest.keys()
+    new_files = new_manifest.keys()
+
+    changed = {
+        filepath
+        for filepath in old_files & new_files
+        if _entry_hash(old_manifest[filepath]) != _entry_hash(new_manifest[filepath])
+    }
 
-    added = list(new_files - old_files)
-    removed = list(old_files - new_files)
+    return {"added": new_files - old_files, "removed": old_files - new_files, "changed": changed}
 
-    changed = []
-    for filepath in old_files & new_files:
-        if old_manifest[filepath] != new_manifest[filepath]:
-            changed.append(filepath)
 
-    return {"added": sorted(added), "removed": sorted(removed), "changed": sorted(changed)}
+def _sample(paths: Set[str], limit: int = 3) -> str:
+    """First few paths in sorted order, without sorting the whole set."""
+    sample = ", ".join(heapq.nsmallest(limit, paths))
+    return sample + ("..." if len(paths) > limit else "")
 
 
 def main():
@@ -188,9 +283,7 @@ def main():
 
     # Check if manifest exists (for detecting changes)
     if manifest_path.exists():
-        import json
-
-        old_manifest = json.loads(manifest_path.read_text())
+        old_manifest = load_hash_manifest(manifest_path)
         print("📝 Found existing hash manifest, checking for changes...")
 
         # Generate new manifest
@@ -202,31 +295,27 @@ def main():
         if any(diff.values()):
             print("\n📊 Documentation Changes Detected:")
             if diff["added"]:
-                print(
-                    f"   ➕ Added ({len(diff['added'])}): {', '.join(diff['added'][:3])}{'...' if len(diff['added']) > 3 else ''}"
-                )
+                print(f"   ➕ Added ({len(diff['added'])}): {_sample(diff['added'])}")
             if diff["removed"]:
-                print(
-                    f"   ➖ Removed ({len(diff['removed'])}): {', '.join(diff['removed'][:3])}{'...' if len(diff['removed']) > 3 else ''}"
-                )
+                print(f"   ➖ Removed ({len(diff['removed'])}): {_sample(diff['removed'])}")
             if diff["changed"]:
-                print(
-                    f"   🔄 Changed ({len(diff['changed'])}): {', '.join(diff['changed'][:3])}{'...' if len(diff['changed']) > 3 else ''}"
-                )
+                print(f"   🔄 Changed ({len(diff['changed'])}): {_sample(diff['changed'])}")
             print()
         else:
             print("   ✅ No changes detected\n")
-
-        # Save new manifest
-        save_hash_manifest(new_manifest, manifest_path)
     else:
         print("📝 No existing hash manifest found, generating initial...")
-        manifest = generate_hash_manifest(project_root)
-        save_hash_manifest(manifest, manifest_path)
+        old_manifest = {}
+        new_manifest = generate_hash_manifest(project_root)
         print(f"   ✅ Saved to {manifest_path}\n")
 
     # Update token counts in INDEX.md
-    updates = update_token_counts(index_path, project_root)
+    updates = update_token_counts(
+        index_path, project_root, old_manifest=old_manifest, new_manifest=new_manifest
+    )
+
+    # Save new manifest, now carrying token counts for the next run
+    save_hash_manifest(new_manifest, manifest_path)
 
     if updates > 0:
         print("\n⚠️  INDEX.md was updated. Remember to:")
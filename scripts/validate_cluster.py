@@ -11,6 +11,7 @@ import socket
 import ssl
 from dataclasses import dataclass
 from enum import Enum
+from functools import cache
 from pathlib import Path
 from typing import Annotated, Optional
 
@@ -30,6 +31,7 @@ from lib.services import (
     OllamaClient,
     OpenWebUIClient,
     SearXNGClient,
+    ServiceClient,
 )
 
 app = typer.Typer(
@@ -109,7 +111,7 @@ def dns(
     ] = False,
 ) -> None:
     """Validate DNS resolution for all services."""
-    results = asyncio.run(_check_dns())
+    results = asyncio.run(_check_dns(get_settings()))
     _print_results(results, "DNS Resolution", verbose)
 
 
@@ -121,7 +123,7 @@ def tls(
     ] = False,
 ) -> None:
     """Validate TLS certificates for all services."""
-    results = asyncio.run(_check_tls())
+    results = asyncio.run(_check_tls(get_settings()))
     _print_results(results, "TLS Certificates", verbose)
 
 
@@ -133,7 +135,7 @@ def services(
     ] = False,
 ) -> None:
     """Validate all service APIs."""
-    results = asyncio.run(_check_services())
+    results = asyncio.run(_check_services(get_settings()))
     _print_results(results, "Service APIs", verbose)
 
 
@@ -145,7 +147,7 @@ def kubernetes(
     ] = False,
 ) -> None:
     """Validate Kubernetes resources."""
-    results = asyncio.run(_check_kubernetes())
+    results = asyncio.run(_check_kubernetes(get_settings()))
     _print_results(results, "Kubernetes", verbose)
 
 
@@ -157,7 +159,7 @@ def models(
     ] = False,
 ) -> None:
     """Validate AI models are available."""
-    results = asyncio.run(_check_models())
+    results = asyncio.run(_check_models(get_settings()))
     _print_results(results, "AI Models", verbose)
 
 
@@ -168,6 +170,7 @@ def models(
 
 async def _run_all_checks(verbose: bool, fix: bool) -> list[CheckResult]:
     """Run all validation checks."""
+    settings = get_settings()
     all_results: list[CheckResult] = []
 
     check_groups = [
@@ -178,9 +181,13 @@ async def _run_all_checks(verbose: bool, fix: bool) -> list[CheckResult]:
         ("AI Models", _check_models),
     ]
 
-    for group_name, check_func in check_groups:
+    # Groups are independent; run them together and report in order
+    group_results = await asyncio.gather(
+        *(check_func(settings) for _, check_func in check_groups)
+    )
+
+    for (group_name, _), results in zip(check_groups, group_results):
         console.print(f"\n[bold]{group_name}[/bold]")
-        results = await check_func()
         all_results.extend(results)
 
         for result in results:
@@ -193,175 +200,204 @@ async def _run_all_checks(verbose: bool, fix: bool) -> list[CheckResult]:
     return all_results
 
 
-async def _check_dns() -> list[CheckResult]:
+# Service subdomains checked for DNS; the first four also serve TLS
+_DNS_SUBDOMAINS = ("ai", "llm", "n8n", "grafana", "search", "git")
+_TLS_SUBDOMAINS = _DNS_SUBDOMAINS[:4]
+
+
+@cache
+def _hostnames(domain: str) -> tuple[str, ...]:
+    """Service hostnames under the platform domain."""
+    return tuple(f"{sub}.{domain}" for sub in _DNS_SUBDOMAINS)
+
+
+@cache
+def _tls_endpoints(domain: str) -> tuple[str, ...]:
+    """HTTPS endpoints whose certificates are checked."""
+    return tuple(f"https://{sub}.{domain}" for sub in _TLS_SUBDOMAINS)
+
+
+async def _check_dns(settings: Settings) -> list[CheckResult]:
     """Check DNS resolution for all service hostnames."""
-    settings = get_settings()
     results: list[CheckResult] = []
 
-    hostnames = [
-        f"ai.{settings.domain}",
-        f"llm.{settings.domain}",
-        f"n8n.{settings.domain}",
-        f"grafana.{settings.domain}",
-        f"search.{settings.domain}",
-        f"git.{settings.domain}",
-    ]
+    hostnames = _hostnames(settings.domain)
+
+    lookups = await asyncio.gather(*(_resolve(hostname) for hostname in hostnames))
 
-    for hostname in hostnames:
-        try:
-            ip = socket.gethostbyname(hostname)
+    for hostname, ip in zip(hostnames, lookups):
+        if isinstance(ip, socket.gaierror):
             results.append(
                 CheckResult(
                     name=hostname,
-                    status=CheckStatus.PASS,
-                    message=f"resolves to {ip}",
+                    status=CheckStatus.FAIL,
+                    message="DNS resolution failed",
+                    details=str(ip),
                 )
             )
-        except socket.gaierror as e:
+        else:
             results.append(
                 CheckResult(
                     name=hostname,
-                    status=CheckStatus.FAIL,
-                    message="DNS resolution failed",
-                    details=str(e),
+                    status=CheckStatus.PASS,
+                    message=f"resolves to {ip}",
                 )
             )
 
     return results
 
 
-async def _check_tls() -> list[CheckResult]:
+async def _resolve(hostname: str) -> str | socket.gaierror:
+    """Resolve a hostname to its first IPv4 address, or the lookup error."""
+    loop = asyncio.get_running_loop()
+    try:
+        infos = await loop.getaddrinfo(
+            hostname, None, family=socket.AF_INET, type=socket.SOCK_STREAM
+        )
+    except socket.gaierror as e:
+        return e
+    return infos[0][4][0]
+
+
+async def _check_tls(settings: Settings) -> list[CheckResult]:
     """Check TLS certificates for all services."""
-    settings = get_settings()
     results: list[CheckResult] = []
 
-    endpoints = [
-        f"https://ai.{settings.domain}",
-        f"https://llm.{settings.domain}",
-        f"https://n8n.{settings.domain}",
-        f"https://grafana.{settings.domain}",
-    ]
+    endpoints = _tls_endpoints(settings.domain)
 
-    for endpoint in endpoints:
-        try:
-            # Allow self-signed certs for now
-            async with httpx.AsyncClient(verify=False, timeout=10.0) as client:
-                response = await client.get(endpoint, follow_redirects=True)
-                results.append(
-                    CheckResult(
-                        name=endpoint,
-                        status=CheckStatus.PASS,
-                        message=f"TLS working (status {response.status_code})",
-                    )
-                )
-        except httpx.ConnectError as e:
+    # Allow self-signed certs for now
+    async with httpx.AsyncClient(verify=False, timeout=10.0) as client:
+        responses = await asyncio.gather(
+            *(client.get(endpoint, follow_redirects=True) for endpoint in endpoints),
+            return_exceptions=True,
+        )
+
+    for endpoint, response in zip(endpoints, responses):
+        if isinstance(response, httpx.ConnectError):
             results.append(
                 CheckResult(
                     name=endpoint,
                     status=CheckStatus.FAIL,
                     message="Connection failed",
-                    details=str(e),
+                    details=str(response),
                 )
             )
-        except Exception as e:
+        elif isinstance(response, Exception):
             results.append(
                 CheckResult(
                     name=endpoint,
                     status=CheckStatus.WARN,
                     message="TLS issue",
-                    details=str(e),
+                    details=str(response),
+                )
+            )
+        elif isinstance(response, BaseException):
+            raise response
+        else:
+            results.append(
+                CheckResult(
+                    name=endpoint,
+                    status=CheckStatus.PASS,
+                    message=f"TLS working (status {response.status_code})",
                 )
             )
 
     return results
 
 
-async def _check_kubernetes() -> list[CheckResult]:
+async def _check_kubernetes(settings: Settings) -> list[CheckResult]:
     """Check Kubernetes resources."""
     results: list[CheckResult] = []
 
-    async with kubernetes_client() as client:
-        # Check critical namespaces
-        for ns in ["self-hosted-ai", "argocd", "cert-manager", "gpu-workloads"]:
-            try:
-                namespace = await client.get_namespace(ns)
-                if namespace:
-                    results.append(
-                        CheckResult(
-                            name=f"namespace/{ns}",
-                            status=CheckStatus.PASS,
-                            message="exists",
-                        )
-                    )
-                else:
-                    results.append(
-                        CheckResult(
-                            name=f"namespace/{ns}",
-                            status=CheckStatus.FAIL,
-                            message="not found",
-                        )
-                    )
-            except Exception as e:
-                results.append(
-                    CheckResult(
-                        name=f"namespace/{ns}",
-                        status=CheckStatus.FAIL,
-                        message=str(e),
-                    )
-                )
+    namespaces = ["self-hosted-ai", "argocd", "cert-manager", "gpu-workloads"]
 
-        # Check critical pods
-        pods = await client.list_pods("self-hosted-ai")
-        running_pods = [p for p in pods if p.get("status") == "Running"]
-        total = len(pods)
-        running = len(running_pods)
+    # The API lookups are independent; issue them all at once
+    async with kubernetes_client(settings) as client, asyncio.TaskGroup() as tg:
+        pods_task = tg.create_task(client.list_pods("self-hosted-ai"))
+        certs_task = tg.create_task(client.list_certificates("self-hosted-ai"))
+        ns_lookups = await asyncio.gather(
+            *(client.get_namespace(ns) for ns in namespaces),
+            return_exceptions=True,
+        )
 
-        if running == total and total > 0:
+    # Check critical namespaces
+    for ns, namespace in zip(namespaces, ns_lookups):
+        if isinstance(namespace, Exception):
             results.append(
                 CheckResult(
-                    name="pods/self-hosted-ai",
-                    status=CheckStatus.PASS,
-                    message=f"{running}/{total} running",
+                    name=f"namespace/{ns}",
+                    status=CheckStatus.FAIL,
+                    message=str(namespace),
                 )
             )
-        elif running > 0:
+        elif isinstance(namespace, BaseException):
+            raise namespace
+        elif namespace:
             results.append(
                 CheckResult(
-                    name="pods/self-hosted-ai",
-                    status=CheckStatus.WARN,
-                    message=f"{running}/{total} running",
+                    name=f"namespace/{ns}",
+                    status=CheckStatus.PASS,
+                    message="exists",
                 )
             )
         else:
             results.append(
                 CheckResult(
-                    name="pods/self-hosted-ai",
+                    name=f"namespace/{ns}",
                     status=CheckStatus.FAIL,
-                    message=f"{running}/{total} running",
+                    message="not found",
                 )
             )
 
-        # Check certificates
-        certs = await client.list_certificates("self-hosted-ai")
-        for cert in certs:
-            name = cert.get("name", "unknown")
-            ready = cert.get("ready", False)
-            results.append(
-                CheckResult(
-                    name=f"certificate/{name}",
-                    status=CheckStatus.PASS if ready else CheckStatus.FAIL,
-                    message="ready" if ready else "not ready",
-                )
+    # Check critical pods
+    pods = pods_task.result()
+    running_pods = [p for p in pods if p.get("status") == "Running"]
+    total = len(pods)
+    running = len(running_pods)
+
+    if running == total and total > 0:
+        results.append(
+            CheckResult(
+                name="pods/self-hosted-ai",
+                status=CheckStatus.PASS,
+                message=f"{running}/{total} running",
+            )
+        )
+    elif running > 0:
+        results.append(
+            CheckResult(
+                name="pods/self-hosted-ai",
+                status=CheckStatus.WARN,
+                message=f"{running}/{total} running",
+            )
+        )
+    else:
+        results.append(
+            CheckResult(
+                name="pods/self-hosted-ai",
+                status=CheckStatus.FAIL,
+                message=f"{running}/{total} running",
             )
+        )
+
+    # Check certificates
+    certs = certs_task.result()
+    for cert in certs:
+        name = cert.get("name", "unknown")
+        ready = cert.get("ready", False)
+        results.append(
+            CheckResult(
+                name=f"certificate/{name}",
+                status=CheckStatus.PASS if ready else CheckStatus.FAIL,
+                message="ready" if ready else "not ready",
+            )
+        )
 
     return results
 
 
-async def _check_services() -> list[CheckResult]:
+async def _check_services(settings: Settings) -> list[CheckResult]:
     """Check all service APIs."""
-    settings = get_settings()
-    results: list[CheckResult] = []
-
     service_checks = [
         ("Open WebUI", OpenWebUIClient(settings)),
         ("LiteLLM", LiteLLMClient(settings)),
@@ -370,84 +406,77 @@ async def _check_services() -> list[CheckResult]:
         ("SearXNG", SearXNGClient(settings)),
     ]
 
-    for name, client in service_checks:
-        try:
-            async with client:
-                health = await client.health_check()
-                if health.get("status") == "healthy":
-                    results.append(
-                        CheckResult(
-                            name=name,
-                            status=CheckStatus.PASS,
-                            message="healthy",
-                            details=health.get("details"),
-                        )
-                    )
-                else:
-                    results.append(
-                        CheckResult(
-                            name=name,
-                            status=CheckStatus.WARN,
-                            message=health.get("status", "unknown"),
-                            details=health.get("error"),
-                        )
-                    )
-        except Exception as e:
-            results.append(
-                CheckResult(
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(_probe_service(name, client)) for name, client in service_checks]
+
+    return [task.result() for task in tasks]
+
+
+async def _probe_service(name: str, client: ServiceClient) -> CheckResult:
+    """Health-check a single service API."""
+    try:
+        async with client:
+            health = await client.health_check()
+            if health.get("status") == "healthy":
+                return CheckResult(
                     name=name,
-                    status=CheckStatus.FAIL,
-                    message="unreachable",
-                    details=str(e),
+                    status=CheckStatus.PASS,
+                    message="healthy",
+                    details=health.get("details"),
                 )
+            return CheckResult(
+                name=name,
+                status=CheckStatus.WARN,
+                message=health.get("status", "unknown"),
+                details=health.get("error"),
             )
-
-    return results
+    except Exception as e:
+        return CheckResult(
+            name=name,
+            status=CheckStatus.FAIL,
+            message="unreachable",
+            details=str(e),
+        )
 
 
-async def _check_models() -> list[CheckResult]:
+async def _check_models(settings: Settings) -> list[CheckResult]:
     """Check AI model availability."""
-    settings = get_settings()
-    results: list[CheckResult] = []
-
     ollama_endpoints = [
         ("Ollama (cluster)", f"http://ollama.self-hosted-ai:11434"),
         ("Ollama (GPU)", f"http://{settings.gpu_worker_ip}:11434"),
     ]
 
-    for name, url in ollama_endpoints:
-        try:
-            async with OllamaClient(url) as client:
-                models = await client.list_models()
-                if models:
-                    model_names = [m.get("name", "unknown") for m in models[:3]]
-                    results.append(
-                        CheckResult(
-                            name=name,
-                            status=CheckStatus.PASS,
-                            message=f"{len(models)} models",
-                            details=", ".join(model_names),
-                        )
-                    )
-                else:
-                    results.append(
-                        CheckResult(
-                            name=name,
-                            status=CheckStatus.WARN,
-                            message="no models loaded",
-                        )
-                    )
-        except Exception as e:
-            results.append(
-                CheckResult(
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(_probe_ollama(name, url)) for name, url in ollama_endpoints]
+
+    return [task.result() for task in tasks]
+
+
+async def _probe_ollama(name: str, url: str) -> CheckResult:
+    """List the models served by a single Ollama endpoint."""
+    try:
+        async with OllamaClient(url) as client:
+            models = await client.list_models()
+            if models:
+                model_names = [m.get("name", "unknown") for m in models[:3]]
+                return CheckResult(
                     name=name,
-                    status=CheckStatus.FAIL,
-                    message="unreachable",
-                    details=str(e),
+                    status=CheckStatus.PASS,
+                    message=f"{len(models)} models",
+                    details=", ".join(model_names),
                 )
+            return CheckResult(
+                name=name,
+                status=CheckStatus.WARN,
+                message="no models loaded",
             )
-
-    return results
+    except Exception as e:
+        return CheckResult(
+            name=name,
+            status=CheckStatus.FAIL,
+            message="unreachable",
+            details=str(e),
+        )
 
 
 def _print_results(results: list[CheckResult], title: str, verbose: bool) -> None:
@@ -9,13 +9,32 @@ Checks:
 - File counts match reality
 """
 
+import mmap
+import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
+# Markdown link target: "[text](target)"
+_LINK_RE = re.compile(r"\[.*?\]\(([^)]+)\)")
+# Token claim, e.g. "ARCHITECTURE.md (1,500 tokens)"
+_TOKEN_RE = re.compile(r"\[([\w\-\.]+\.md)\]\([^)]+\).*?\(([0-9,]+)\s+tokens\)")
+# File count table row, e.g. "| argocd/applications/ | ~30 |"
+_COUNT_RE = re.compile(r"\|\s*([\w\-\/]+)\s*\|\s*~?(\d+)\s*\|")
+# Run of non-whitespace bytes, i.e. one word
+_WORD_RE = re.compile(rb"\S+")
+# Bare doc mention outside a link, e.g. "see docs/OPERATIONS.md"
+_DOC_MENTION_RE = re.compile(r"[\w\-\./]+\.md")
 
-def count_tokens(text: str) -> int:
+# Directories never descended into when collecting docs
+_EXCLUDE_DIRS = {"node_modules", ".venv", "site-packages"}
+_EXCLUDE_PATHS = {"docs/archive"}  # Archive docs intentionally not in INDEX
+
+
+def count_tokens(path: Path) -> int:
     """
     Rough token estimate using empirically validated formula.
 
@@ -25,15 +44,59 @@ def count_tokens(text: str) -> int:
     - Technical docs: ~1.4 tokens per word
 
     Using conservative 1.3x multiplier for general documentation.
+    Words are counted straight off a memory map of the file (split on ASCII
+    whitespace), so the doc is never decoded or copied.
     """
-    words = len(text.split())
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return 0  # mmap rejects empty files
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            words = sum(1 for _ in _WORD_RE.finditer(mm))
     return int(words * 1.3)
 
 
+@lru_cache(maxsize=None)
+def _read(path: str) -> str:
+    """Read a file once per run; INDEX.md is shared by every check."""
+    return Path(path).read_text()
+
+
+@lru_cache(maxsize=None)
+def _count_tokens_for(path: str) -> int:
+    """Token estimate for a file, computed once per run."""
+    return count_tokens(Path(path))
+
+
+@lru_cache(maxsize=None)
+def _all_docs(project_root: Path) -> Tuple[Path, ...]:
+    """Every markdown file under the project, pruning excluded directories."""
+    docs = []
+    for root, dirs, files in os.walk(project_root):
+        rel_root = os.path.relpath(root, project_root)
+        dirs[:] = [
+            d
+            for d in dirs
+            if d not in _EXCLUDE_DIRS
+            and not d.endswith("dist-info")
+            and os.path.normpath(os.path.join(rel_root, d)) not in _EXCLUDE_PATHS
+        ]
+        docs.extend(Path(root, f) for f in files if f.endswith(".md"))
+    return tuple(docs)
+
+
+@lru_cache(maxsize=None)
+def _doc_index(project_root: Path) -> Dict[str, Path]:
+    """Map each doc filename to its first location in the project."""
+    index: Dict[str, Path] = {}
+    for doc in _all_docs(project_root):
+        index.setdefault(doc.name, doc)
+    return index
+
+
 def find_broken_links(index_path: Path) -> List[str]:
     """Find broken links in INDEX.md."""
-    index_text = index_path.read_text()
-    links = re.findall(r"\[.*?\]\(([^)]+)\)", index_text)
+    index_text = _read(str(index_path))
+    links = _LINK_RE.findall(index_text)
 
     broken = []
     for link in links:
@@ -55,30 +118,23 @@ def find_broken_links(index_path: Path) -> List[str]:
 
 def find_unreferenced_docs(index_path: Path, project_root: Path) -> List[Path]:
     """Find markdown files not referenced in INDEX.md."""
-    index_text = index_path.read_text()
-
-    # Exclude these from check
-    exclude_patterns = [
-        "**/node_modules/**",
-        "**/.venv/**",
-        "**/site-packages/**",
-        "**/dist-info/**",
-        "docs/archive/**",  # Archive docs intentionally not in INDEX
-    ]
-
-    all_docs = []
-    for pattern in ["*.md", "**/*.md"]:
-        for doc in project_root.rglob(pattern):
-            if not any(doc.match(excl) for excl in exclude_patterns):
-                all_docs.append(doc)
+    index_text = _read(str(index_path))
+
+    # Everything INDEX points at, by link target and by bare mention
+    referenced = set()
+    for ref in _LINK_RE.findall(index_text) + _DOC_MENTION_RE.findall(index_text):
+        ref = ref.split("#", 1)[0]
+        referenced.add(ref)
+        referenced.add(ref.lstrip("./"))
+        referenced.add(Path(ref).name)
 
     unreferenced = []
-    for doc in all_docs:
+    for doc in _all_docs(project_root):
         # Check if doc is mentioned in INDEX (by filename or path)
         doc_name = doc.name
         relative_path = doc.relative_to(project_root)
 
-        if str(doc_name) not in index_text and str(relative_path) not in index_text:
+        if doc_name not in referenced and str(relative_path) not in referenced:
             # Exclude README.md in subdirs (usually referenced indirectly)
             if doc_name != "README.md":
                 unreferenced.append(relative_path)
@@ -88,26 +144,25 @@ def find_unreferenced_docs(index_path: Path, project_root: Path) -> List[Path]:
 
 def validate_token_budgets(index_path: Path, project_root: Path) -> List[Tuple[str, int, int]]:
     """Check if token budgets in INDEX match actual doc sizes."""
-    index_text = index_path.read_text()
+    index_text = _read(str(index_path))
 
     # Extract token claims from INDEX (e.g., "ARCHITECTURE.md (1,500 tokens)")
-    pattern = r"\[([\w\-\.]+\.md)\]\([^)]+\).*?\(([0-9,]+)\s+tokens\)"
-    claims = re.findall(pattern, index_text)
+    claims = _TOKEN_RE.findall(index_text)
+
+    doc_index = _doc_index(project_root)
 
     mismatches = []
     for doc_name, claimed_tokens_str in claims:
         claimed_tokens = int(claimed_tokens_str.replace(",", ""))
 
         # Find the actual doc
-        candidates = list(project_root.rglob(doc_name))
-        if not candidates:
+        doc_path = doc_index.get(doc_name)
+        if doc_path is None:
             continue
 
-        actual_tokens = count_tokens(candidates[0].read_text())
-        variance = abs(actual_tokens - claimed_tokens) / claimed_tokens
-
-        # Flag if variance > 20%
-        if variance > 0.20:
+        actual_tokens = _count_tokens_for(str(doc_path))
+        # Flag if variance > 20% (integer form of |delta| / claimed > 0.20)
+        if abs(actual_tokens - claimed_tokens) * 100 > 20 * claimed_tokens:
             mismatches.append((doc_name, claimed_tokens, actual_tokens))
 
     return mismatches
@@ -115,11 +170,10 @@ def validate_token_budgets(index_path: Path, project_root: Path) -> List[Tuple[s
 
 def validate_file_counts(index_path: Path, project_root: Path) -> List[Tuple[str, int, int]]:
     """Check if file counts in INDEX match actual counts."""
-    index_text = index_path.read_text()
+    index_text = _read(str(index_path))
 
     # Extract file count claims (e.g., "argocd/applications/ | ~30 |")
-    pattern = r"\|\s*([\w\-\/]+)\s*\|\s*~?(\d+)\s*\|"
-    claims = re.findall(pattern, index_text)
+    claims = _COUNT_RE.findall(index_text)
 
     mismatches = []
     for dir_path, claimed_count_str in claims:
@@ -132,10 +186,8 @@ def validate_file_counts(index_path: Path, project_root: Path) -> List[Tuple[str
 
         actual_count = len(list(dir_full.glob("*")))
 
-        variance = abs(actual_count - claimed_count) / max(claimed_count, 1)
-
         # Flag if variance > 30% (some flexibility for minor changes)
-        if variance > 0.30:
+        if abs(actual_count - claimed_count) * 100 > 30 * max(claimed_count, 1):
             mismatches.append((dir_path, claimed_count, actual_count))
 
     return mismatches
@@ -152,11 +204,18 @@ def main():
 
     print("🔍 Validating documentation index...\n")
 
+    # Checks only read shared inputs; run them together, report in order
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        links_future = pool.submit(find_broken_links, index_path)
+        unreferenced_future = pool.submit(find_unreferenced_docs, index_path, project_root)
+        tokens_future = pool.submit(validate_token_budgets, index_path, project_root)
+        counts_future = pool.submit(validate_file_counts, index_path, project_root)
+
     errors = 0
 
     # Check 1: Broken links
     print("1. Checking for broken links...")
-    broken_links = find_broken_links(index_path)
+    broken_links = links_future.result()
     if broken_links:
         print(f"   ❌ Found {len(broken_links)} broken links:")
         for link in broken_links:
@@ -167,7 +226,7 @@ def main():
 
     # Check 2: Unreferenced docs
     print("\n2. Checking for unreferenced documentation...")
-    unreferenced = find_unreferenced_docs(index_path, project_root)
+    unreferenced = unreferenced_future.result()
     if unreferenced:
         print(f"   ⚠️  Found {len(unreferenced)} unreferenced docs:")
         for doc in unreferenced:
@@ -178,7 +237,7 @@ def main():
 
     # Check 3: Token budgets
     print("\n3. Checking token budget accuracy...")
-    token_mismatches = validate_token_budgets(index_path, project_root)
+    token_mismatches = tokens_future.result()
     if token_mismatches:
         print(f"   ⚠️  Found {len(token_mismatches)} token budget mismatches:")
         for doc, claimed, actual in token_mismatches:
@@ -191,7 +250,7 @@ def main():
 
     # Check 4: File counts
     print("\n4. Checking file count accuracy...")
-    count_mismatches = validate_file_counts(index_path, project_root)
+    count_mismatches = counts_future.result()
     if count_mismatches:
         print(f"   ⚠️  Found {len(count_mismatches)} file count mismatches:")
         for dir_path, claimed, actual in count_mismatches:
@@ -0,0 +1,121 @@
+"""Agent unit test fixtures (no cluster required).
+
+Registered from the root conftest via ``pytest_plugins`` so the agent
+fixtures live in one module shared by every test directory.
+"""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+# Config, agents and sample data are never mutated by tests, so they are built
+# once per session (agents once per module). mock_httpx_client records calls
+# and stays function-scoped.
+#
+# The agents package (and httpx with it) is imported inside each fixture, so
+# collection and test runs that never request an agent don't pay for it.
+
+
+@pytest.fixture(scope="session")
+def agent_config():
+    """Create a default agent configuration for testing."""
+    from agents.core.base import AgentConfig
+
+    return AgentConfig(
+        name="test-agent",
+        agent_type="test",
+        model="qwen2.5-coder:14b",
+        ollama_url="http://localhost:11434",
+        temperature=0.7,
+        timeout_seconds=60,
+    )
+
+
+@pytest.fixture(scope="module")
+def research_agent(agent_config):
+    """Create a Research agent instance."""
+    from agents.specialized.research import ResearchAgent
+
+    return ResearchAgent(agent_config)
+
+
+@pytest.fixture(scope="module")
+def development_agent(agent_config):
+    """Create a Development agent instance."""
+    from agents.specialized.development import DevelopmentAgent
+
+    return DevelopmentAgent(agent_config)
+
+
+@pytest.fixture(scope="module")
+def code_review_agent(agent_config):
+    """Create a Code Review agent instance."""
+    from agents.specialized.code_review import CodeReviewAgent
+
+    return CodeReviewAgent(agent_config)
+
+
+@pytest.fixture(scope="module")
+def testing_agent(agent_config):
+    """Create a Testing agent instance."""
+    from agents.specialized.testing import TestingAgent
+
+    return TestingAgent(agent_config)
+
+
+@pytest.fixture(scope="module")
+def documentation_agent(agent_config):
+    """Create a Documentation agent instance."""
+    from agents.specialized.documentation import DocumentationAgent
+
+    return DocumentationAgent(agent_config)
+
+
+@pytest.fixture(scope="session")
+def mock_ollama_response():
+    """Mock Ollama API response."""
+    return {
+        "response": "This is a mock response from Ollama",
+        "created_at": "2026-01-10T12:00:00Z",
+        "model": "qwen2.5-coder:14b",
+        "done": True,
+    }
+
+
+@pytest.fixture
+def mock_httpx_client(mock_ollama_response):
+    """Mock httpx AsyncClient for API calls."""
+    mock_response = Mock()
+    mock_response.json.return_value = mock_ollama_response
+    mock_response.raise_for_status = Mock()
+
+    mock_client = AsyncMock()
+    mock_client.post.return_value = mock_response
+    mock_client.__aenter__.return_value = mock_client
+    mock_client.__aexit__.return_value = None
+
+    return mock_client
+
+
+@pytest.fixture(scope="session")
+def sample_python_code():
+    """Sample Python code for testing."""
+    return '''def fibonacci(n: int) -> int:
+    """Calculate the nth Fibonacci number."""
+    if n <= 1:
+        return n
+    return fibonacci(n-1) + fibonacci(n-2)
+'''
+
+
+@pytest.fixture(scope="session")
+def sample_rust_code():
+    """Sample Rust code for testing."""
+    return """fn fibonacci(n: u32) -> u32 {
+    match n {
+        0 => 0,
+        1 => 1,
+        _ => fibonacci(n - 1) + fibonacci(n - 2),
+    }
+}
+"""
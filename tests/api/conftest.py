@@ -2,14 +2,159 @@
 
 Provides pre-configured HTTP clients for each service endpoint.
 Tests in this module require cluster access (services must be reachable).
+
+Set VCR_MODE (a VCR.py record mode: "once", "new_episodes", "all" or
+"none") to run through pytest-recording cassettes under cassettes/.
+Record with VCR_MODE=new_episodes against a live cluster, then replay
+offline with VCR_MODE=none. Unset, every test talks to the cluster.
 """
 
+import asyncio
 import os
+import ssl
 import subprocess
+from pathlib import Path
 
 import httpx
 import pytest
 
+# Shared across clients so each one doesn't build its own SSL context.
+# Certificate verification is off: services use cluster-internal CAs.
+_SSL_NOVERIFY = ssl.create_default_context()
+_SSL_NOVERIFY.check_hostname = False
+_SSL_NOVERIFY.verify_mode = ssl.CERT_NONE
+
+_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
+_INFERENCE_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+# Clients live for the whole session (per xdist worker), so keep idle
+# connections around long enough to be reused by later test files.
+_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=300)
+
+# Connectivity probe: a refused or filtered port should fail in seconds
+_PROBE_TIMEOUT = httpx.Timeout(5.0, connect=2.0)
+
+_VCR_MODE = os.environ.get("VCR_MODE")
+_API_DIR = Path(__file__).parent
+
+
+def pytest_collection_modifyitems(config, items):
+    """Route API tests through recorded cassettes when VCR_MODE is set."""
+    if not _VCR_MODE:
+        return
+    for item in items:
+        if _API_DIR in item.path.parents:
+            item.add_marker(pytest.mark.vcr)
+
+
+def _service_urls(config):
+    """External URL probed for each name accepted by the ``needs`` marker."""
+    return {
+        "keycloak": f"https://keycloak.{config.DOMAIN}/",
+        "grafana": config.GRAFANA_EXTERNAL,
+        "prometheus": config.GRAFANA_EXTERNAL.replace("grafana", "prometheus"),
+        "litellm": config.LITELLM_EXTERNAL,
+        "openwebui": config.OPENWEBUI_EXTERNAL,
+        "n8n": config.N8N_EXTERNAL,
+        "searxng": config.SEARXNG_EXTERNAL,
+        "argocd": config.ARGOCD_EXTERNAL,
+        "mcp": f"https://mcp.{config.DOMAIN}/",
+    }
+
+
+async def _connectivity(urls):
+    """HEAD every URL concurrently; map each name to a failure reason or None."""
+
+    async def check(client, url):
+        try:
+            await client.head(url)
+        except httpx.HTTPError as e:
+            return f"{url} unreachable ({type(e).__name__})"
+        return None
+
+    async with httpx.AsyncClient(verify=_SSL_NOVERIFY, timeout=_PROBE_TIMEOUT) as client:
+        reasons = await asyncio.gather(*(check(client, url) for url in urls.values()))
+    return dict(zip(urls, reasons, strict=True))
+
+
+@pytest.fixture(scope="session")
+def service_unreachable(platform_config):
+    """Why each service can't be used this session, or None if it answered.
+
+    Every service is probed at once on first use, so a cluster-down run costs
+    one connect timeout instead of one per test. Replayed cassettes need no
+    live services, so nothing is probed under VCR_MODE.
+    """
+    if _VCR_MODE:
+        return {}
+    return asyncio.run(_connectivity(_service_urls(platform_config)))
+
+
+@pytest.fixture(autouse=True)
+def _skip_unreachable(request):
+    """Skip tests marked ``needs(service)`` when that service did not answer."""
+    marker = request.node.get_closest_marker("needs")
+    if marker is None:
+        return
+    reason = request.getfixturevalue("service_unreachable").get(marker.args[0])
+    if reason:
+        pytest.skip(reason)
+
+
+@pytest.fixture(scope="module")
+def vcr_config():
+    """pytest-recording settings; credentials never reach a cassette."""
+    return {
+        "filter_headers": ["authorization", "cookie", "set-cookie"],
+        "record_mode": _VCR_MODE or "none",
+    }
+
+
+def _probe(client, method, url, *, reason, skip=False, **kwargs):
+    """Send a request, failing (or skipping) the test if it can't be delivered.
+
+    Only transport errors are handled here; status and body assertions stay
+    in the test so they always fail loudly.
+    """
+    try:
+        return client.request(method, url, **kwargs)
+    except httpx.HTTPError as e:
+        (pytest.skip if skip else pytest.fail)(f"{reason}: {e}")
+
+
+@pytest.fixture(scope="session")
+def probe():
+    """Provide the request-or-fail/skip helper."""
+    return _probe
+
+
+@pytest.fixture(scope="session")
+def ssl_noverify():
+    """Provide the SSL context the session clients use, for ad-hoc async clients."""
+    return _SSL_NOVERIFY
+
+
+def _reach(client, url, *, reason, skip=False, **kwargs):
+    """Check a URL answers without downloading its body.
+
+    Sends HEAD without following redirects; endpoints that refuse HEAD get
+    a streamed GET that is closed before the body is read.
+    """
+    try:
+        response = client.head(url, follow_redirects=False, **kwargs)
+        if response.status_code in (405, 501):
+            with client.stream("GET", url, follow_redirects=False, **kwargs) as response:
+                pass
+        return response
+    except httpx.HTTPError as e:
+        (pytest.skip if skip else pytest.fail)(f"{reason}: {e}")
+
+
+@pytest.fixture(scope="session")
+def reach():
+    """Provide the status-only variant of ``probe``."""
+    return _reach
+
 
 def _port_forward_or_skip(namespace, service, local_port, remote_port):
     """Attempt to set up port-forward; skip if not possible."""
@@ -18,18 +163,19 @@ def _port_forward_or_skip(namespace, service, local_port, remote_port):
     pass
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def ollama_gpu_client(platform_config):
     """HTTP client targeting Ollama GPU service."""
     client = httpx.Client(
         base_url=platform_config.GPU_WORKER_OLLAMA,
-        timeout=httpx.Timeout(60.0, connect=10.0),
+        timeout=_INFERENCE_TIMEOUT,
+        limits=_LIMITS,
     )
     yield client
     client.close()
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def litellm_client(platform_config):
     """HTTP client targeting LiteLLM proxy."""
     headers = {}
@@ -37,57 +183,179 @@ def litellm_client(platform_config):
         headers["Authorization"] = f"Bearer {platform_config.LITELLM_MASTER_KEY}"
     client = httpx.Client(
         base_url=platform_config.LITELLM_EXTERNAL,
-        timeout=httpx.Timeout(60.0, connect=10.0),
+        timeout=_INFERENCE_TIMEOUT,
         headers=headers,
-        verify=False,
+        verify=_SSL_NOVERIFY,
+        http2=True,
+        limits=_LIMITS,
     )
     yield client
     client.close()
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def openwebui_client(platform_config):
     """HTTP client targeting Open WebUI."""
     client = httpx.Client(
         base_url=platform_config.OPENWEBUI_EXTERNAL,
-        timeout=httpx.Timeout(30.0, connect=10.0),
-        verify=False,
+        timeout=_TIMEOUT,
+        verify=_SSL_NOVERIFY,
+        http2=True,
+        limits=_LIMITS,
     )
     yield client
     client.close()
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
+def openwebui_admin_token(platform_config, webui_admin_login):
+    """JWT for the Open WebUI admin, from the session-wide sign-in."""
+    if not platform_config.WEBUI_ADMIN_PASSWORD:
+        pytest.skip("WEBUI_ADMIN_PASSWORD not set")
+    token, reason = webui_admin_login
+    assert token, reason
+    return token
+
+
+@pytest.fixture(scope="session")
 def searxng_client(platform_config):
     """HTTP client targeting SearXNG."""
     client = httpx.Client(
         base_url=platform_config.SEARXNG_EXTERNAL,
-        timeout=httpx.Timeout(30.0, connect=10.0),
-        verify=False,
+        timeout=_TIMEOUT,
+        verify=_SSL_NOVERIFY,
+        http2=True,
+        limits=_LIMITS,
     )
     yield client
     client.close()
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def grafana_client(platform_config):
     """HTTP client targeting Grafana."""
     client = httpx.Client(
         base_url=platform_config.GRAFANA_EXTERNAL,
-        timeout=httpx.Timeout(30.0, connect=10.0),
-        verify=False,
+        timeout=_TIMEOUT,
+        verify=_SSL_NOVERIFY,
+        http2=True,
+        limits=_LIMITS,
     )
     yield client
     client.close()
 
 
-@pytest.fixture(scope="module")
+@pytest.fixture(scope="session")
 def argocd_client(platform_config):
     """HTTP client targeting ArgoCD."""
     client = httpx.Client(
         base_url=platform_config.ARGOCD_EXTERNAL,
-        timeout=httpx.Timeout(30.0, connect=10.0),
-        verify=False,
+        timeout=_TIMEOUT,
+        verify=_SSL_NOVERIFY,
+        http2=True,
+        limits=_LIMITS,
     )
     yield client
     client.close()
+
+
+@pytest.fixture(scope="session")
+def keycloak_oidc(http_client, platform_config):
+    """OIDC discovery document for the vectorweight realm, fetched once."""
+    for host in ("keycloak", "sso"):
+        url = (
+            f"https://{host}.{platform_config.DOMAIN}"
+            "/realms/vectorweight/.well-known/openid-configuration"
+        )
+        try:
+            response = http_client.get(url)
+        except httpx.HTTPError:
+            continue
+        if response.status_code == 200:
+            return response.json()
+
+    pytest.skip("OIDC discovery endpoint not reachable at expected URLs")
+
+
+@pytest.fixture(scope="session")
+def keycloak_realm(http_client, platform_config):
+    """Public metadata for the vectorweight realm, fetched once."""
+    try:
+        response = http_client.get(f"https://keycloak.{platform_config.DOMAIN}/realms/vectorweight")
+    except httpx.HTTPError as e:
+        pytest.skip(f"Cannot verify realm: {e}")
+    if response.status_code != 200:
+        pytest.skip(f"Realm endpoint returned {response.status_code}")
+    return response.json()
+
+
+@pytest.fixture(scope="session")
+def ollama_gpu_unreachable(ollama_gpu_client):
+    """Why Ollama GPU can't be used this session, or None if it is reachable.
+
+    Probed once per session (per xdist worker) with a short connect timeout
+    so a refused or filtered port fails fast.
+    """
+    try:
+        response = ollama_gpu_client.get("/", timeout=httpx.Timeout(5.0, connect=2.0))
+    except httpx.HTTPError:
+        return (
+            "Ollama GPU not reachable (connection refused). "
+            "Service is a K8s ClusterIP — run tests from within cluster "
+            "or use kubectl port-forward."
+        )
+    if response.status_code != 200:
+        return (
+            f"Ollama GPU not reachable (status {response.status_code}). "
+            "Service is a K8s ClusterIP — run tests from within cluster."
+        )
+    return None
+
+
+@pytest.fixture(scope="session")
+def ollama_tags(ollama_gpu_client, ollama_gpu_unreachable):
+    """Models reported by Ollama GPU's /api/tags, fetched once."""
+    if ollama_gpu_unreachable:
+        pytest.skip(ollama_gpu_unreachable)
+    response = ollama_gpu_client.get("/api/tags")
+    assert response.status_code == 200, f"/api/tags returned {response.status_code}"
+    return response.json().get("models", [])
+
+
+@pytest.fixture(scope="session")
+def ollama_model_resident(ollama_gpu_client, ollama_gpu_unreachable, platform_config):
+    """Whether TEST_MODEL is already loaded in Ollama GPU memory (/api/ps)."""
+    if ollama_gpu_unreachable:
+        return False
+    try:
+        response = ollama_gpu_client.get("/api/ps", timeout=httpx.Timeout(5.0, connect=2.0))
+    except httpx.HTTPError:
+        return False
+    if response.status_code != 200:
+        return False
+    loaded = {m.get("name") for m in response.json().get("models", [])}
+    return platform_config.TEST_MODEL in loaded
+
+
+@pytest.fixture(scope="session")
+def inference_timeout(ollama_model_resident):
+    """Read timeout for inference requests.
+
+    Tight when the test model is already resident, so a stuck backend fails
+    fast; generous otherwise to cover a cold model load.
+    """
+    return httpx.Timeout(20.0 if ollama_model_resident else 120.0, connect=3.0)
+
+
+@pytest.fixture(scope="session")
+def self_hosted_ai_pods(kubectl_available, platform_config):
+    """Pods in the self-hosted-ai namespace, listed once via the Kubernetes API."""
+    if not kubectl_available:
+        pytest.skip("kubectl not available")
+    from kubernetes import client, config
+
+    try:
+        config.load_kube_config(config_file=platform_config.KUBECONFIG)
+        return client.CoreV1Api().list_namespaced_pod("self-hosted-ai", _request_timeout=30).items
+    except Exception as e:
+        pytest.skip(f"Cannot query pods: {e}")
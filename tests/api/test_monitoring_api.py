@@ -7,95 +7,154 @@ Tests Grafana, Prometheus, and Tempo endpoints:
 - Trace query
 """
 
+import asyncio
+
+import httpx
+import ijson
 import pytest
 
 pytestmark = [pytest.mark.api]
 
 
+@pytest.mark.needs("grafana")
 class TestGrafanaHealth:
     """Validate Grafana is reachable and configured."""
 
-    def test_grafana_reachable(self, grafana_client):
+    @pytest.mark.isolated
+    def test_grafana_reachable(self, grafana_client, probe):
         """Grafana should be reachable."""
-        try:
-            response = grafana_client.get("/api/health")
-            assert response.status_code == 200, f"Grafana health returned {response.status_code}"
-            data = response.json()
-            assert data.get("database") == "ok", f"Grafana database not ok: {data}"
-        except Exception as e:
-            pytest.fail(f"Cannot reach Grafana: {e}")
-
-    def test_grafana_has_datasources(self, grafana_client):
-        """Grafana should have data sources configured."""
-        try:
-            response = grafana_client.get("/api/datasources")
-            if response.status_code == 401:
-                pytest.skip("Grafana requires authentication for datasources API")
-            assert response.status_code == 200
-            datasources = response.json()
-            assert len(datasources) > 0, "No data sources configured in Grafana"
-        except Exception as e:
-            pytest.skip(f"Cannot check Grafana datasources: {e}")
-
+        response = probe(grafana_client, "GET", "/api/health", reason="Cannot reach Grafana")
+        assert response.status_code == 200, f"Grafana health returned {response.status_code}"
+        data = response.json()
+        assert data.get("database") == "ok", f"Grafana database not ok: {data}"
 
+    @pytest.mark.isolated
+    def test_grafana_has_datasources(self, grafana_client, probe):
+        """Grafana should have data sources configured."""
+        response = probe(
+            grafana_client,
+            "GET",
+            "/api/datasources",
+            reason="Cannot check Grafana datasources",
+            skip=True,
+        )
+        if response.status_code == 401:
+            pytest.skip("Grafana requires authentication for datasources API")
+        if response.status_code != 200:
+            pytest.skip(f"Grafana datasources API returned {response.status_code}")
+        datasources = response.json()
+        assert len(datasources) > 0, "No data sources configured in Grafana"
+
+
+@pytest.mark.needs("prometheus")
 class TestPrometheusHealth:
     """Validate Prometheus is scraping metrics."""
 
-    def test_prometheus_reachable(self, http_client, platform_config):
+    @pytest.mark.isolated
+    def test_prometheus_reachable(self, http_client, platform_config, probe):
         """Prometheus should be reachable."""
-        try:
-            response = http_client.get(
-                f"{platform_config.GRAFANA_EXTERNAL.replace('grafana', 'prometheus')}/-/healthy"
+        prom_url = platform_config.GRAFANA_EXTERNAL.replace("grafana", "prometheus")
+        reason = "Cannot reach Prometheus"
+        response = probe(http_client, "GET", f"{prom_url}/-/healthy", reason=reason, skip=True)
+        if response.status_code == 404:
+            # Try alternative health endpoint
+            response = probe(
+                http_client,
+                "GET",
+                f"{prom_url}/api/v1/status/runtimeinfo",
+                reason=reason,
+                skip=True,
             )
-            if response.status_code == 404:
-                # Try alternative health endpoint
-                response = http_client.get(
-                    f"{platform_config.GRAFANA_EXTERNAL.replace('grafana', 'prometheus')}/api/v1/status/runtimeinfo"
-                )
-            assert response.status_code == 200, f"Prometheus health returned {response.status_code}"
-        except Exception as e:
-            pytest.skip(f"Cannot reach Prometheus: {e}")
+        if response.status_code != 200:
+            pytest.skip(f"Prometheus health returned {response.status_code}")
 
+    @pytest.mark.isolated
     def test_prometheus_has_targets(self, http_client, platform_config):
         """Prometheus should have active scrape targets."""
+        prom_url = platform_config.GRAFANA_EXTERNAL.replace("grafana", "prometheus")
+        # The targets document can be large; stop reading at the first target
+        active = ijson.sendable_list()
+        parser = ijson.items_coro(active, "data.activeTargets.item")
         try:
-            prom_url = platform_config.GRAFANA_EXTERNAL.replace("grafana", "prometheus")
-            response = http_client.get(f"{prom_url}/api/v1/targets")
-            if response.status_code != 200:
-                pytest.skip("Cannot query Prometheus targets")
-
-            data = response.json()
-            active = data.get("data", {}).get("activeTargets", [])
-            assert len(active) > 0, "No active scrape targets in Prometheus"
-        except Exception as e:
+            with http_client.stream("GET", f"{prom_url}/api/v1/targets") as response:
+                if response.status_code != 200:
+                    pytest.skip("Cannot query Prometheus targets")
+                for chunk in response.iter_bytes():
+                    parser.send(chunk)
+                    if active:
+                        break
+                else:
+                    parser.close()
+        except httpx.HTTPError as e:
             pytest.skip(f"Cannot check Prometheus targets: {e}")
+        except ijson.JSONError as e:
+            # e.g. an SSO login page served with a 200
+            pytest.skip(f"Prometheus targets response is not JSON: {e}")
 
+        assert active, "No active scrape targets in Prometheus"
 
-class TestArgocdHealth:
-    """Validate ArgoCD API is accessible."""
 
-    def test_argocd_reachable(self, argocd_client):
-        """ArgoCD should be reachable."""
-        try:
-            response = argocd_client.get("/healthz")
-            if response.status_code == 404:
-                response = argocd_client.get("/api/version")
-            assert response.status_code in (200, 302, 401), (
-                f"ArgoCD returned {response.status_code}"
+class TestMonitoringStack:
+    """Check Grafana and Prometheus together in one concurrent batch."""
+
+    @pytest.mark.asyncio
+    async def test_monitoring_stack_healthy(self, grafana_client, platform_config, ssl_noverify):
+        """Grafana must be healthy; Prometheus data is checked wherever it is reachable."""
+        grafana_url = str(grafana_client.base_url).rstrip("/")
+        prom_url = platform_config.GRAFANA_EXTERNAL.replace("grafana", "prometheus")
+
+        async with httpx.AsyncClient(timeout=30, verify=ssl_noverify, http2=True) as client:
+            health, datasources, prom_health, targets = await asyncio.gather(
+                client.get(f"{grafana_url}/api/health"),
+                client.get(f"{grafana_url}/api/datasources"),
+                client.get(f"{prom_url}/-/healthy"),
+                client.get(f"{prom_url}/api/v1/targets"),
+                return_exceptions=True,
             )
-        except Exception as e:
-            pytest.fail(f"Cannot reach ArgoCD: {e}")
 
-    def test_argocd_version(self, argocd_client):
-        """ArgoCD should report its version."""
+        if isinstance(health, Exception):
+            pytest.fail(f"Cannot reach Grafana: {health}")
+        assert health.status_code == 200, f"Grafana health returned {health.status_code}"
         try:
-            response = argocd_client.get("/api/version")
-            if response.status_code == 401:
-                pytest.skip("ArgoCD requires auth for version endpoint")
-            assert response.status_code == 200
-            data = response.json()
-            assert "Version" in data or "version" in data, (
-                "ArgoCD version response missing version field"
-            )
-        except Exception as e:
-            pytest.skip(f"Cannot check ArgoCD version: {e}")
+            health_data = health.json()
+        except ValueError:
+            pytest.skip("Grafana health response is not JSON (likely an SSO page)")
+        assert health_data.get("database") == "ok", f"Grafana database not ok: {health.text}"
+
+        # The rest may sit behind auth or lack an ingress, so only a clear
+        # answer counts: JSON content on success, or a server error from Prometheus
+        if not isinstance(datasources, Exception) and datasources.status_code == 200:
+            try:
+                configured = datasources.json()
+            except ValueError:
+                configured = None
+            if configured is not None:
+                assert len(configured) > 0, "No data sources configured in Grafana"
+        if not isinstance(prom_health, Exception) and prom_health.status_code >= 500:
+            pytest.fail(f"Prometheus health returned {prom_health.status_code}")
+        if not isinstance(targets, Exception) and targets.status_code == 200:
+            try:
+                active = targets.json().get("data", {}).get("activeTargets", [])
+            except ValueError:
+                active = None
+            if active is not None:
+                assert len(active) > 0, "No active scrape targets in Prometheus"
+
+
+@pytest.mark.needs("argocd")
+class TestArgocdHealth:
+    """Validate ArgoCD API is accessible."""
+
+    def test_argocd_version(self, argocd_client, probe):
+        """ArgoCD should report its version."""
+        response = probe(
+            argocd_client, "GET", "/api/version", reason="Cannot check ArgoCD version", skip=True
+        )
+        if response.status_code == 401:
+            pytest.skip("ArgoCD requires auth for version endpoint")
+        if response.status_code != 200:
+            pytest.skip(f"ArgoCD version endpoint returned {response.status_code}")
+        data = response.json()
+        assert "Version" in data or "version" in data, (
+            "ArgoCD version response missing version field"
+        )
@@ -11,27 +11,34 @@ NOTE: Ollama GPU runs as a K8s ClusterIP service. Tests will skip
 if the service is not reachable (e.g., running outside the cluster).
 """
 
+import asyncio
+import json
+from pathlib import Path
+
+import httpx
+import orjson
 import pytest
 
 pytestmark = [pytest.mark.api, pytest.mark.critical]
 
+EMBEDDING_MODEL = "nomic-embed-text"
+EMBEDDING_SHAPES = json.loads(
+    (Path(__file__).parent / "snapshots" / "embedding_shapes.json").read_text()
+)
+
+
+def _embedding_dims(response):
+    """Decode an /api/embeddings response and return its vector length."""
+    embedding = orjson.loads(response.content).get("embedding")
+    assert embedding is not None, "Missing 'embedding' in response"
+    return len(embedding)
+
 
 @pytest.fixture(scope="module", autouse=True)
-def _check_ollama_reachable(ollama_gpu_client):
+def _check_ollama_reachable(ollama_gpu_unreachable):
     """Skip entire module if Ollama GPU is not reachable."""
-    try:
-        response = ollama_gpu_client.get("/", timeout=5)
-        if response.status_code != 200:
-            pytest.skip(
-                f"Ollama GPU not reachable (status {response.status_code}). "
-                "Service is a K8s ClusterIP — run tests from within cluster."
-            )
-    except Exception:
-        pytest.skip(
-            "Ollama GPU not reachable (connection refused). "
-            "Service is a K8s ClusterIP — run tests from within cluster "
-            "or use kubectl port-forward."
-        )
+    if ollama_gpu_unreachable:
+        pytest.skip(ollama_gpu_unreachable)
 
 
 class TestOllamaGPUHealth:
@@ -42,28 +49,25 @@ class TestOllamaGPUHealth:
         response = ollama_gpu_client.get("/")
         assert response.status_code == 200, f"Ollama GPU returned {response.status_code}"
 
-    def test_ollama_gpu_has_models(self, ollama_gpu_client):
+    def test_ollama_gpu_has_models(self, ollama_tags):
         """Ollama GPU should have models loaded."""
-        response = ollama_gpu_client.get("/api/tags")
-        assert response.status_code == 200
-        data = response.json()
-        models = data.get("models", [])
-        assert len(models) > 0, "No models found on Ollama GPU"
+        assert len(ollama_tags) > 0, "No models found on Ollama GPU"
 
 
 class TestOllamaGPUModels:
     """Validate required models are available on GPU."""
 
-    def test_required_gpu_models_present(self, ollama_gpu_client, platform_config):
+    def test_required_gpu_models_present(self, ollama_tags, platform_config):
         """All required GPU models should be available."""
-        response = ollama_gpu_client.get("/api/tags")
-        data = response.json()
-        model_names = [m["name"] for m in data.get("models", [])]
+        model_names = [m["name"] for m in ollama_tags]
+        # Exact base-name hits are a set lookup; only misses fall back to the
+        # looser prefix scan (e.g. "llava" also matching "llava-llama3")
+        bases = {name.split(":")[0] for name in model_names}
 
         missing = []
         for required in platform_config.REQUIRED_MODELS_GPU:
-            found = any(m.startswith(required.split(":")[0]) for m in model_names)
-            if not found:
+            prefix = required.split(":")[0]
+            if prefix not in bases and not any(b.startswith(prefix) for b in bases):
                 missing.append(required)
 
         assert not missing, f"Missing GPU models: {missing}\nAvailable: {sorted(model_names)}"
@@ -73,7 +77,9 @@ class TestOllamaGeneration:
     """Test text generation capabilities."""
 
     @pytest.mark.slow
-    def test_generate_text(self, ollama_gpu_client, platform_config):
+    @pytest.mark.xdist_group(name="inference")
+    @pytest.mark.isolated
+    def test_generate_text(self, ollama_gpu_client, platform_config, inference_timeout):
         """Ollama should generate text from a simple prompt."""
         response = ollama_gpu_client.post(
             "/api/generate",
@@ -83,7 +89,7 @@ class TestOllamaGeneration:
                 "stream": False,
                 "options": {"num_predict": 32},
             },
-            timeout=120,
+            timeout=inference_timeout,
         )
         assert response.status_code == 200, (
             f"Generation failed: {response.status_code} {response.text}"
@@ -94,7 +100,9 @@ class TestOllamaGeneration:
         assert data.get("done") is True, "Generation did not complete"
 
     @pytest.mark.slow
-    def test_chat_completion(self, ollama_gpu_client, platform_config):
+    @pytest.mark.xdist_group(name="inference")
+    @pytest.mark.isolated
+    def test_chat_completion(self, ollama_gpu_client, platform_config, inference_timeout):
         """Ollama should handle chat-style completions."""
         response = ollama_gpu_client.post(
             "/api/chat",
@@ -104,7 +112,7 @@ class TestOllamaGeneration:
                 "stream": False,
                 "options": {"num_predict": 16},
             },
-            timeout=120,
+            timeout=inference_timeout,
         )
         assert response.status_code == 200
         data = response.json()
@@ -116,21 +124,77 @@ class TestOllamaEmbeddings:
     """Test embedding generation."""
 
     @pytest.mark.slow
+    @pytest.mark.xdist_group(name="inference")
+    @pytest.mark.isolated
     def test_generate_embeddings(self, ollama_gpu_client):
         """Ollama should generate embeddings from text."""
         response = ollama_gpu_client.post(
             "/api/embeddings",
             json={
-                "model": "nomic-embed-text",
+                "model": EMBEDDING_MODEL,
                 "prompt": "Test embedding text for validation.",
             },
             timeout=60,
         )
         assert response.status_code == 200
-        data = response.json()
-        assert "embedding" in data, "Missing 'embedding' in response"
-        embedding = data["embedding"]
-        assert len(embedding) > 100, f"Embedding too short: {len(embedding)} dimensions"
+        dims = _embedding_dims(response)
+        expected = EMBEDDING_SHAPES[EMBEDDING_MODEL]
+        assert dims == expected, f"Embedding has {dims} dimensions, snapshot says {expected}"
+
+
+class TestOllamaInferenceBattery:
+    """Run generation, chat and embeddings concurrently against Ollama GPU."""
+
+    @pytest.mark.slow
+    @pytest.mark.xdist_group(name="inference")
+    @pytest.mark.asyncio
+    async def test_inference_battery(self, ollama_gpu_client, platform_config, inference_timeout):
+        """Generate, chat and embed requests should all succeed when issued together."""
+        async with httpx.AsyncClient(
+            base_url=ollama_gpu_client.base_url, timeout=inference_timeout
+        ) as client:
+            generate, chat, embed = await asyncio.gather(
+                client.post(
+                    "/api/generate",
+                    json={
+                        "model": platform_config.TEST_MODEL,
+                        "prompt": "What is 2+2? Reply with just the number.",
+                        "stream": False,
+                        "options": {"num_predict": 32},
+                    },
+                ),
+                client.post(
+                    "/api/chat",
+                    json={
+                        "model": platform_config.TEST_MODEL,
+                        "messages": [{"role": "user", "content": "Say hello in one word."}],
+                        "stream": False,
+                        "options": {"num_predict": 16},
+                    },
+                ),
+                client.post(
+                    "/api/embeddings",
+                    json={
+                        "model": EMBEDDING_MODEL,
+                        "prompt": "Test embedding text for validation.",
+                    },
+                ),
+            )
+
+        assert generate.status_code == 200, (
+            f"Generation failed: {generate.status_code} {generate.text}"
+        )
+        data = generate.json()
+        assert data.get("response"), "Empty response from model"
+        assert data.get("done") is True, "Generation did not complete"
+
+        assert chat.status_code == 200, f"Chat failed: {chat.status_code} {chat.text}"
+        assert chat.json().get("message", {}).get("content"), "Empty chat response"
+
+        assert embed.status_code == 200, f"Embedding failed: {embed.status_code} {embed.text}"
+        dims = _embedding_dims(embed)
+        expected = EMBEDDING_SHAPES[EMBEDDING_MODEL]
+        assert dims == expected, f"Embedding has {dims} dimensions, snapshot says {expected}"
 
 
 class TestOllamaModelInfo:
@@ -7,6 +7,7 @@ Tests the Open WebUI chat interface:
 - Configuration
 """
 
+import httpx
 import pytest
 
 pytestmark = [pytest.mark.api, pytest.mark.critical]
@@ -15,25 +16,13 @@ pytestmark = [pytest.mark.api, pytest.mark.critical]
 class TestOpenWebUIHealth:
     """Validate Open WebUI is reachable and healthy."""
 
-    def test_health_endpoint(self, openwebui_client):
+    def test_health_endpoint(self, openwebui_client, probe):
         """Open WebUI health endpoint should return 200."""
-        try:
-            response = openwebui_client.get("/health")
-            assert response.status_code == 200, f"Open WebUI health returned {response.status_code}"
-        except Exception as e:
-            pytest.fail(f"Cannot reach Open WebUI: {e}")
-
-    def test_root_page_loads(self, openwebui_client):
-        """Open WebUI root page should load (returns HTML or redirect)."""
-        try:
-            response = openwebui_client.get("/")
-            assert response.status_code in (200, 302, 303), (
-                f"Open WebUI root returned {response.status_code}"
-            )
-        except Exception as e:
-            pytest.fail(f"Cannot load Open WebUI root: {e}")
+        response = probe(openwebui_client, "GET", "/health", reason="Cannot reach Open WebUI")
+        assert response.status_code == 200, f"Open WebUI health returned {response.status_code}"
 
 
+@pytest.mark.needs("openwebui")
 class TestOpenWebUIAuth:
     """Validate Open WebUI authentication."""
 
@@ -46,28 +35,13 @@ class TestOpenWebUIAuth:
         )
 
     @pytest.mark.slow
-    def test_login_with_credentials(self, openwebui_client, platform_config):
+    def test_login_with_credentials(self, openwebui_admin_token):
         """Should be able to login with admin credentials."""
-        if not platform_config.WEBUI_ADMIN_PASSWORD:
-            pytest.skip("WEBUI_ADMIN_PASSWORD not set")
-
-        try:
-            response = openwebui_client.post(
-                "/api/v1/auths/signin",
-                json={
-                    "email": platform_config.WEBUI_ADMIN_EMAIL,
-                    "password": platform_config.WEBUI_ADMIN_PASSWORD,
-                },
-            )
-            assert response.status_code == 200, (
-                f"Login failed: {response.status_code} {response.text}"
-            )
-            data = response.json()
-            assert "token" in data, "Login response missing token"
-        except Exception as e:
-            pytest.fail(f"Login failed: {e}")
+        # Sign-in and its assertions happen once, in the session fixture
+        assert openwebui_admin_token
 
 
+@pytest.mark.needs("openwebui")
 class TestOpenWebUIConfiguration:
     """Validate Open WebUI configuration."""
 
@@ -82,21 +56,21 @@ class TestOpenWebUIConfiguration:
                     "name": "Test User",
                 },
             )
-            # Should fail with 403 or 400 (signup disabled)
-            assert response.status_code in (400, 403, 422), (
-                f"Signup should be disabled, got {response.status_code}"
-            )
-        except Exception as e:
+        except httpx.HTTPError:
             # Connection error is also acceptable (endpoint may not exist)
-            pass
+            return
+        # Should fail with 403 or 400 (signup disabled)
+        assert response.status_code in (400, 403, 422), (
+            f"Signup should be disabled, got {response.status_code}"
+        )
 
-    def test_oauth_configured(self, openwebui_client):
+    def test_oauth_configured(self, openwebui_client, probe):
         """OAuth/OIDC configuration should be present."""
-        try:
-            # The auth page should mention Keycloak as a login option
-            response = openwebui_client.get("/")
-            # We cannot easily verify OIDC from external API
-            # This is better tested manually
-            assert response.status_code in (200, 302, 303)
-        except Exception as e:
-            pytest.skip(f"Cannot verify OAuth config: {e}")
+        # The auth page should mention Keycloak as a login option
+        response = probe(
+            openwebui_client, "GET", "/", reason="Cannot verify OAuth config", skip=True
+        )
+        # We cannot easily verify OIDC from external API
+        # This is better tested manually
+        if response.status_code not in (200, 302, 303):
+            pytest.skip(f"Cannot verify OAuth config: root returned {response.status_code}")
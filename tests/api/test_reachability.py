@@ -0,0 +1,77 @@
+"""Service reachability tests.
+
+One parametrized check per externally exposed service: HEAD its root or
+health path (falling back to a second path on 404) and expect a status
+that shows the service, or the SSO proxy in front of it, is answering.
+Only the status line is needed, so no response bodies are downloaded.
+"""
+
+import pytest
+
+pytestmark = [pytest.mark.api]
+
+# service, client fixture, paths (second is the 404 fallback), accepted
+# statuses, and whether an unreachable service skips rather than fails
+REACHABILITY = [
+    pytest.param(
+        "Keycloak",
+        "http_client",
+        # Keycloak may not have external ingress
+        lambda c: (f"https://keycloak.{c.DOMAIN}/",),
+        (200, 302, 303),
+        True,
+        id="keycloak",
+    ),
+    pytest.param(
+        "n8n",
+        "http_client",
+        lambda c: (f"{c.N8N_EXTERNAL}/healthz", c.N8N_EXTERNAL),
+        (200, 302, 401),
+        False,
+        id="n8n",
+    ),
+    pytest.param(
+        "SearXNG",
+        "searxng_client",
+        # 401 = oauth2-proxy SSO is protecting the endpoint (expected)
+        lambda c: ("/",),
+        (200, 302, 401),
+        False,
+        id="searxng",
+    ),
+    pytest.param(
+        "Open WebUI",
+        "openwebui_client",
+        lambda c: ("/",),
+        (200, 302, 303),
+        False,
+        id="openwebui",
+        marks=pytest.mark.critical,
+    ),
+    pytest.param(
+        "ArgoCD",
+        "argocd_client",
+        lambda c: ("/healthz", "/api/version"),
+        (200, 302, 401),
+        False,
+        id="argocd",
+    ),
+]
+
+
+@pytest.mark.parametrize("service,client_fixture,paths,accepted,skip", REACHABILITY)
+def test_service_reachable(
+    request, platform_config, reach, service, client_fixture, paths, accepted, skip
+):
+    """Each service should answer with an expected status."""
+    client = request.getfixturevalue(client_fixture)
+    primary, *fallback = paths(platform_config)
+    reason = f"Cannot reach {service}"
+
+    response = reach(client, primary, reason=reason, skip=skip)
+    if response.status_code == 404 and fallback:
+        response = reach(client, fallback[0], reason=reason, skip=skip)
+
+    if skip and response.status_code not in accepted:
+        pytest.skip(f"{service} not reachable externally: returned {response.status_code}")
+    assert response.status_code in accepted, f"{service} returned {response.status_code}"
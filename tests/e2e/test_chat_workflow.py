@@ -5,6 +5,9 @@ Tests complete user workflows:
 - Multi-turn conversation
 """
 
+import asyncio
+
+import httpx
 import pytest
 
 pytestmark = [pytest.mark.e2e, pytest.mark.slow]
@@ -100,17 +103,18 @@ class TestChatWorkflow:
 class TestModelComparison:
     """Test multiple models can serve the same query."""
 
-    def test_same_query_different_models(self, ollama_gpu_client, platform_config):
+    @pytest.mark.asyncio
+    @pytest.mark.xdist_group(name="ollama-gpu")
+    async def test_same_query_different_models(self, ollama_gpu_client, platform_config):
         """Different models should all respond to the same prompt."""
         if platform_config.SKIP_GPU_TESTS:
             pytest.skip("GPU tests disabled")
 
         models = [platform_config.TEST_MODEL, platform_config.TEST_GPU_MODEL]
-        results = {}
 
-        for model in models:
+        async def generate(client, model):
             try:
-                response = ollama_gpu_client.post(
+                response = await client.post(
                     "/api/generate",
                     json={
                         "model": model,
@@ -118,12 +122,17 @@ class TestModelComparison:
                         "stream": False,
                         "options": {"num_predict": 16},
                     },
-                    timeout=120,
                 )
-                if response.status_code == 200:
-                    results[model] = response.json().get("response", "")
             except Exception as e:
-                results[model] = f"ERROR: {e}"
+                return f"ERROR: {e}"
+            if response.status_code == 200:
+                return response.json().get("response", "")
+            return None
+
+        # Independent requests: wall time tracks the slowest model, not the sum
+        async with httpx.AsyncClient(base_url=ollama_gpu_client.base_url, timeout=120) as client:
+            replies = await asyncio.gather(*(generate(client, m) for m in models))
+        results = {m: r for m, r in zip(models, replies, strict=True) if r is not None}
 
         successful = {m: r for m, r in results.items() if not r.startswith("ERROR")}
         assert len(successful) >= 1, f"No models responded successfully. Results: {results}"
@@ -4,41 +4,43 @@ import httpx
 import pytest
 
 
-@pytest.fixture(scope="module")
-def authenticated_webui_client(platform_config):
-    """Create an authenticated Open WebUI client.
+@pytest.fixture(scope="session")
+def _webui_auth_state(platform_config, webui_admin_login):
+    """Build the authenticated Open WebUI client once and remember the outcome.
 
-    Logs in with admin credentials and uses the JWT token
-    for subsequent requests.
+    Holds either ``{"client": ...}`` or ``{"skip_reason": ...}`` so a failed
+    or unconfigured login is decided once, without further network I/O.
+    The token comes from the session-wide ``webui_admin_login``.
     """
-    if not platform_config.WEBUI_ADMIN_PASSWORD:
-        pytest.skip("WEBUI_ADMIN_PASSWORD not set for integration tests")
+    token, skip_reason = webui_admin_login
+    if skip_reason:
+        yield {"skip_reason": skip_reason}
+        return
 
     client = httpx.Client(
         base_url=platform_config.OPENWEBUI_EXTERNAL,
+        headers={"Authorization": f"Bearer {token}"},
         timeout=httpx.Timeout(60.0, connect=10.0),
-        verify=False,
+        # Retries cover failed connects only; the client settings move onto
+        # the transport because an explicit transport ignores them
+        transport=httpx.HTTPTransport(
+            verify=False,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60),
+            retries=2,
+        ),
     )
-
-    try:
-        response = client.post(
-            "/api/v1/auths/signin",
-            json={
-                "email": platform_config.WEBUI_ADMIN_EMAIL,
-                "password": platform_config.WEBUI_ADMIN_PASSWORD,
-            },
-        )
-        if response.status_code != 200:
-            pytest.skip(f"Cannot login to Open WebUI: {response.status_code}")
-
-        token = response.json().get("token")
-        if not token:
-            pytest.skip("Login succeeded but no token returned")
-
-        client.headers["Authorization"] = f"Bearer {token}"
-    except Exception as e:
-        client.close()
-        pytest.skip(f"Authentication failed: {e}")
-
-    yield client
+    yield {"client": client}
     client.close()
+
+
+@pytest.fixture
+def authenticated_webui_client(_webui_auth_state):
+    """Authenticated Open WebUI client, shared across the session.
+
+    Logs in with admin credentials once and uses the JWT token
+    for subsequent requests over a shared keep-alive HTTP/2 connection.
+    """
+    if "skip_reason" in _webui_auth_state:
+        pytest.skip(_webui_auth_state["skip_reason"])
+    return _webui_auth_state["client"]
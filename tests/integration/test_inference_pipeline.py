@@ -7,6 +7,9 @@ Tests the complete inference path:
 - Multi-model chaining
 """
 
+import asyncio
+
+import httpx
 import pytest
 
 pytestmark = [pytest.mark.integration, pytest.mark.critical, pytest.mark.slow]
@@ -130,28 +133,33 @@ class TestOpenWebUIToOllama:
 class TestModelRouting:
     """Test model routing and fallback behavior."""
 
-    def test_multiple_models_respond(self, ollama_gpu_client, platform_config):
-        """Multiple models should be able to respond sequentially."""
+    @pytest.mark.asyncio
+    @pytest.mark.xdist_group(name="ollama-gpu")
+    async def test_multiple_models_respond(self, ollama_gpu_client, platform_config):
+        """Multiple models should be able to respond concurrently."""
         models_to_test = [platform_config.TEST_MODEL]
         if not platform_config.SKIP_GPU_TESTS:
             models_to_test.append(platform_config.TEST_GPU_MODEL)
 
-        results = {}
-        for model in models_to_test:
+        async def responds(client, model):
             try:
-                response = ollama_gpu_client.post(
+                response = await client.post(
                     "/api/generate",
                     json={
                         "model": model,
-                        "prompt": f"What model are you? One sentence.",
+                        "prompt": "What model are you? One sentence.",
                         "stream": False,
                         "options": {"num_predict": 32},
                     },
-                    timeout=120,
                 )
-                results[model] = response.status_code == 200
             except Exception:
-                results[model] = False
+                return False
+            return response.status_code == 200
+
+        # Independent requests: wall time tracks the slowest model, not the sum
+        async with httpx.AsyncClient(base_url=ollama_gpu_client.base_url, timeout=120) as client:
+            oks = await asyncio.gather(*(responds(client, m) for m in models_to_test))
+        results = dict(zip(models_to_test, oks, strict=True))
 
         passed = [m for m, ok in results.items() if ok]
         failed = [m for m, ok in results.items() if not ok]
@@ -22,6 +22,18 @@ def cluster_pods(kubectl_available, kubectl):
     return kubectl("pods", all_namespaces=True)
 
 
+@pytest.fixture(scope="module")
+def pod_phases(kubectl_available, kubectl):
+    """(namespace, name, phase) for every pod, without the full pod objects."""
+    if not kubectl_available:
+        pytest.skip("kubectl not available or cluster not reachable")
+    return kubectl(
+        "pods",
+        all_namespaces=True,
+        fields=(".metadata.namespace", ".metadata.name", ".status.phase"),
+    )
+
+
 @pytest.fixture(scope="module")
 def cluster_namespaces(kubectl_available, kubectl):
     """Get all namespaces."""
@@ -73,22 +85,13 @@ def cluster_secrets(kubectl_available, kubectl):
     """Get all secrets (names only, not data)."""
     if not kubectl_available:
         pytest.skip("kubectl not available or cluster not reachable")
-    result = subprocess.run(
-        [
-            "kubectl",
-            "get",
-            "secrets",
-            "-A",
-            "-o",
-            "jsonpath={range .items[*]}{.metadata.namespace}/{.metadata.name}{'\\n'}{end}",
-        ],
-        capture_output=True,
-        text=True,
-        timeout=30,
-    )
-    if result.returncode != 0:
+    try:
+        rows = kubectl(
+            "secrets", all_namespaces=True, fields=(".metadata.namespace", ".metadata.name")
+        )
+    except RuntimeError:
         pytest.skip("Cannot list secrets")
-    return result.stdout.strip().split("\n")
+    return [f"{ns}/{name}" for ns, name in rows]
 
 
 @pytest.fixture(scope="module")
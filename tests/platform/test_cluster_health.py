@@ -93,14 +93,11 @@ class TestPodHealth:
                     crashing.append(f"{ns}/{name}")
         assert not crashing, f"Pods in CrashLoopBackOff: {crashing}"
 
-    def test_critical_services_running(self, cluster_pods, platform_config):
+    def test_critical_services_running(self, pod_phases, platform_config):
         """Critical service pods should be Running."""
         pod_map = {}
-        for pod in cluster_pods["items"]:
-            ns = pod["metadata"]["namespace"]
-            name = pod["metadata"]["name"]
-            phase = pod["status"].get("phase", "Unknown")
-            pod_map.setdefault(ns, []).append((name, phase))
+        for ns, name, phase in pod_phases:
+            pod_map.setdefault(ns, []).append((name, phase or "Unknown"))
 
         missing = []
         for ns, services in platform_config.CRITICAL_SERVICES.items():
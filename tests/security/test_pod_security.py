@@ -25,24 +25,11 @@ PSS_NAMESPACES = [
 class TestPodSecurityContext:
     """Validate pod security contexts."""
 
-    def test_no_privileged_pods(self, kubectl_available):
+    def test_no_privileged_pods(self, all_pods):
         """No pods in AI namespaces should run as privileged."""
-        if not kubectl_available:
-            pytest.skip("kubectl not available")
-
         privileged = []
         for ns in PSS_NAMESPACES:
-            result = subprocess.run(
-                ["kubectl", "get", "pods", "-n", ns, "-o", "json"],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-            if result.returncode != 0:
-                continue
-
-            data = json.loads(result.stdout)
-            for pod in data.get("items", []):
+            for pod in all_pods[ns]:
                 name = pod["metadata"]["name"]
                 spec = pod.get("spec", {})
 
@@ -56,48 +43,22 @@ class TestPodSecurityContext:
             f"  - {p}" for p in privileged
         )
 
-    def test_no_host_network(self, kubectl_available):
+    def test_no_host_network(self, all_pods):
         """Pods should not use host networking."""
-        if not kubectl_available:
-            pytest.skip("kubectl not available")
-
         host_net = []
         for ns in PSS_NAMESPACES:
-            result = subprocess.run(
-                ["kubectl", "get", "pods", "-n", ns, "-o", "json"],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-            if result.returncode != 0:
-                continue
-
-            data = json.loads(result.stdout)
-            for pod in data.get("items", []):
+            for pod in all_pods[ns]:
                 name = pod["metadata"]["name"]
                 if pod.get("spec", {}).get("hostNetwork"):
                     host_net.append(f"{ns}/{name}")
 
         assert not host_net, f"Pods using host network:\n" + "\n".join(f"  - {p}" for p in host_net)
 
-    def test_containers_drop_all_capabilities(self, kubectl_available):
+    def test_containers_drop_all_capabilities(self, all_pods):
         """Containers should drop ALL capabilities."""
-        if not kubectl_available:
-            pytest.skip("kubectl not available")
-
         missing_drop = []
         for ns in PSS_NAMESPACES:
-            result = subprocess.run(
-                ["kubectl", "get", "pods", "-n", ns, "-o", "json"],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-            if result.returncode != 0:
-                continue
-
-            data = json.loads(result.stdout)
-            for pod in data.get("items", []):
+            for pod in all_pods[ns]:
                 name = pod["metadata"]["name"]
                 for container in pod.get("spec", {}).get("containers", []):
                     sc = container.get("securityContext", {})